@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import logging
+import socket
+from types import TracebackType
+
+from fastosc.message.arg_value import ArgValue
+from fastosc.message.batch import DEFAULT_MTU, MessageBatcher
+from fastosc.message.convert import convert_message
+
+# Max time a queued message waits for more messages to the same destination.
+DEFAULT_FLUSH_INTERVAL = 0.005
+
+
+class OSCClient:
+    """
+    UDP OSC client that sends messages to any number of destinations.
+
+    Every destination gets its own connected socket, which is reused for all sends to it. By default every
+    message is sent right away.
+
+    With a flush_interval (e.g. DEFAULT_FLUSH_INTERVAL), messages queued for the same destination are coalesced
+    into bundles of at most mtu bytes, which are sent once they are full, once the oldest queued message is
+    flush_interval seconds old, or on flush(). There is no timer, the age is only checked on send() and poll(),
+    so the caller must call poll() regularly (or flush()), otherwise the last messages stay queued.
+    """
+
+    def __init__(
+        self,
+        *,
+        logger: logging.Logger,
+        mtu: int = DEFAULT_MTU,
+        flush_interval: float | None = None,
+    ) -> None:
+        self._logger = logger
+        self._flush_interval = flush_interval
+        self._batcher = MessageBatcher(mtu=mtu)
+        self._sockets: dict[tuple[str, int], socket.socket] = {}
+
+    def _socket_for(self, remote_addr: tuple[str, int]) -> socket.socket:
+        sock = self._sockets.get(remote_addr)
+        if sock is None:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.connect(remote_addr)
+            self._sockets[remote_addr] = sock
+        return sock
+
+    def _send_datagram(self, remote_addr: tuple[str, int], dgram: bytes) -> None:
+        try:
+            self._socket_for(remote_addr).send(dgram)
+        except OSError as e:
+            self._logger.error(f"Could not send OSC datagram to {remote_addr}: {e}")
+            sock = self._sockets.pop(remote_addr, None)
+            if sock is not None:
+                sock.close()
+
+    def send(self, *, address: str, params: list[ArgValue], remote_addr: tuple[str, int]) -> None:
+        """
+        Queue a message for a destination, sending whatever batches are due.
+
+        Raises:
+            BuildError: if the message could not be built
+        """
+        dgram = convert_message(address=address, params=params)
+        if self._flush_interval is None:
+            self._send_datagram(remote_addr, dgram)
+            return
+        for ready in self._batcher.add(remote_addr, dgram):
+            self._send_datagram(remote_addr, ready)
+        self.poll()
+
+    def poll(self) -> None:
+        """
+        Send the batches of all destinations that waited flush_interval seconds or more.
+        """
+        for remote_addr in self._batcher.due(self._flush_interval or 0):
+            for dgram in self._batcher.flush(remote_addr):
+                self._send_datagram(remote_addr, dgram)
+
+    def flush(self) -> None:
+        """
+        Send everything queued.
+        """
+        for remote_addr, dgram in self._batcher.flush_all():
+            self._send_datagram(remote_addr, dgram)
+
+    def close(self) -> None:
+        """
+        Flush queued messages and close all sockets.
+        """
+        self.flush()
+        for sock in self._sockets.values():
+            sock.close()
+        self._sockets = {}
+
+    def __enter__(self) -> OSCClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
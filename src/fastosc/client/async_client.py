@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from fastosc.client import DEFAULT_FLUSH_INTERVAL
+from fastosc.message.arg_value import ArgValue
+from fastosc.message.batch import DEFAULT_MTU, MessageBatcher
+from fastosc.message.convert import convert_message
+
+
+class AsyncOSCClient:
+    """
+    asyncio variant of OSCClient.
+
+    Every destination gets its own connected datagram transport, created on the first send to it. Messages
+    queued for the same destination are coalesced into bundles of at most mtu bytes, which are sent once they
+    are full or by a timer flush_interval seconds after the first message was queued.
+    A flush_interval of None disables batching and sends every message right away.
+    """
+
+    def __init__(
+        self,
+        *,
+        logger: logging.Logger,
+        mtu: int = DEFAULT_MTU,
+        flush_interval: float | None = DEFAULT_FLUSH_INTERVAL,
+    ) -> None:
+        self._logger = logger
+        self._flush_interval = flush_interval
+        self._batcher = MessageBatcher(mtu=mtu)
+        self._transports: dict[tuple[str, int], asyncio.DatagramTransport] = {}
+        self._timers: dict[tuple[str, int], asyncio.TimerHandle] = {}
+
+    async def _transport_for(self, remote_addr: tuple[str, int]) -> asyncio.DatagramTransport:
+        transport = self._transports.get(remote_addr)
+        if transport is None:
+            loop = asyncio.get_running_loop()
+            transport, _ = await loop.create_datagram_endpoint(asyncio.DatagramProtocol, remote_addr=remote_addr)
+            # another send may have connected while this one was waiting
+            if remote_addr in self._transports:
+                transport.close()
+                return self._transports[remote_addr]
+            self._transports[remote_addr] = transport
+        return transport
+
+    def _send_datagram(self, remote_addr: tuple[str, int], dgram: bytes) -> None:
+        transport = self._transports.get(remote_addr)
+        if transport is None:
+            self._logger.error(f"Could not send OSC datagram to {remote_addr}: not connected")
+            return
+        transport.sendto(dgram)
+
+    async def send(self, *, address: str, params: list[ArgValue], remote_addr: tuple[str, int]) -> None:
+        """
+        Queue a message for a destination, sending the pending batch first if the message does not fit in it.
+
+        Raises:
+            BuildError: if the message could not be built
+        """
+        dgram = convert_message(address=address, params=params)
+        await self._transport_for(remote_addr)
+        if self._flush_interval is None:
+            self._send_datagram(remote_addr, dgram)
+            return
+        for ready in self._batcher.add(remote_addr, dgram):
+            self._send_datagram(remote_addr, ready)
+        if self._batcher.pending_size(remote_addr) and remote_addr not in self._timers:
+            loop = asyncio.get_running_loop()
+            self._timers[remote_addr] = loop.call_later(self._flush_interval, self._flush_destination, remote_addr)
+
+    def _flush_destination(self, remote_addr: tuple[str, int]) -> None:
+        timer = self._timers.pop(remote_addr, None)
+        if timer is not None:
+            timer.cancel()
+        for dgram in self._batcher.flush(remote_addr):
+            self._send_datagram(remote_addr, dgram)
+
+    def flush(self) -> None:
+        """
+        Send everything queued.
+        """
+        for remote_addr in list(self._timers):
+            self._flush_destination(remote_addr)
+        for remote_addr, dgram in self._batcher.flush_all():
+            self._send_datagram(remote_addr, dgram)
+
+    def close(self) -> None:
+        """
+        Flush queued messages and close all transports.
+        """
+        self.flush()
+        for transport in self._transports.values():
+            transport.close()
+        self._transports = {}
@@ -1,28 +1,67 @@
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
-import re
-from typing import Callable
+from typing import Awaitable, Callable
 
+from fastosc.cache import CacheStats, LRUCache
+from fastosc.dispatcher.address_index import AddressIndex, is_pattern
+from fastosc.dispatcher.executor import OrderedExecutor
 from fastosc.dispatcher.handler import HandlerInfo
+from fastosc.dispatcher.scheduler import BundleScheduler
 from fastosc.docs import HandlerDescription, HandlerInputParam
 from fastosc.message.arg_value import ArgValue
 from fastosc.message.osc_bundle import OscBundle
+from fastosc.message.osc_bundle import ParseError as BundleParseError
 from fastosc.message.osc_message import OscMessage
+from fastosc.message.parsing import ntp
 from fastosc.server.server_base import OSCServerBase
 
 MAX_LINE_LENGTH = 45
+DEFAULT_MATCH_CACHE_SIZE = 256
 
 
 class Dispatcher:
-    def __init__(self, *, logger: logging.Logger, base_address: str = "") -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        logger: logging.Logger,
+        base_address: str = "",
+        match_cache_size: int = DEFAULT_MATCH_CACHE_SIZE,
+        executor: OrderedExecutor | None = None,
+        scheduler: BundleScheduler | None = None,
+    ) -> None:
+        """
+        Args:
+            logger: logger for routing information and errors
+            base_address: address prefix for all handlers
+            match_cache_size: number of address patterns to cache the matched handlers for (0 to disable)
+            executor: run handlers on this thread pool instead of the receiving thread, messages from the same
+                      remote address are still handled one at a time and in order. Worker threads have no
+                      event loop, so async handlers can't be added to a dispatcher with an executor. Handlers
+                      added with inline=True (like the router's listener and heartbeat handlers) still run on
+                      the receiving thread
+            scheduler: hold bundles with a future time tag until their time, instead of dispatching every bundle
+                       right away (release them with tick() or the scheduler's own timer thread)
+        """
+        self._scheduler = scheduler
+        self._tasks: set[asyncio.Future] = set()
         self._server: OSCServerBase | None = None
+        self._executor = executor
         self._callbacks: dict[str, Callable[[list[ArgValue], tuple[str, int]], list[ArgValue]]] = {}
+        self._inline_addresses: set[str] = set()
+        self._address_index = AddressIndex()
+        self._match_cache: LRUCache[
+            str,
+            list[tuple[str, Callable[[list[ArgValue], tuple[str, int]], list[ArgValue]]]],
+        ] = LRUCache(match_cache_size)
         self._logger = logger
         if not base_address.startswith("/"):
             base_address = f"/{base_address}"
         self._base_address = base_address
         self._handler_docs: list[HandlerDescription] = []
+        self._tick_handlers: list[Callable[[], None]] = []
 
     def set_server(self, server: OSCServerBase) -> None:
         self._server = server
@@ -33,6 +72,7 @@ class Dispatcher:
         address: str,
         handler: Callable[[list[ArgValue], tuple[str, int]], list[ArgValue]],
         handler_info: HandlerInfo | None = None,
+        inline: bool = False,
     ) -> None:
         """
         Add an OSC handler.
@@ -42,12 +82,23 @@ class Dispatcher:
             handler: A handler function, with signature:
                      params: Tuple[Any, ...]
             handler_info: metadata about the incoming message
+            inline: run the handler on the receiving thread even if the dispatcher has an executor, for
+                    handlers that change state which tick handlers change too. Such a message may be handled
+                    before earlier messages of the same client that are still queued on the executor
         """
+        if self._executor is not None and inspect.iscoroutinefunction(handler):
+            raise ValueError(f"Async handler for {address} can't run on the executor threads, they have no event loop")
         if not address.startswith("/"):
             address = f"/{address}"
         address = f"{self._base_address}{address}"
         route_log_info = f"Added route {address}"
         self._callbacks[address] = handler
+        if inline:
+            self._inline_addresses.add(address)
+        else:
+            self._inline_addresses.discard(address)
+        self._address_index.add(address)
+        self._match_cache.clear()
         if handler_info:
             s = handler_info.signature
             params = [
@@ -84,6 +135,42 @@ class Dispatcher:
         """
 
         self._callbacks = {}
+        self._inline_addresses = set()
+        self._address_index.clear()
+        self._match_cache.clear()
+
+    def add_tick_handler(self, handler: Callable[[], None]) -> None:
+        """
+        Add a function to call on every tick(), for work that is deferred rather than triggered by a message.
+        """
+        self._tick_handlers.append(handler)
+
+    def remove_tick_handler(self, handler: Callable[[], None]) -> None:
+        """
+        Remove a function added with add_tick_handler().
+        """
+        if handler in self._tick_handlers:
+            self._tick_handlers.remove(handler)
+
+    def tick(self) -> None:
+        """
+        Release due bundles and run the tick handlers. Servers call this on every process() call (or periodically
+        for the asyncio server), before sending queued output.
+        """
+        if self._scheduler is not None:
+            self._scheduler.release_due()
+        for handler in self._tick_handlers:
+            try:
+                handler()
+            except Exception as e:  # noqa
+                self._logger.error(f"Error in OSC tick handler: {e}")
+
+    @property
+    def match_cache_stats(self) -> CacheStats:
+        """
+        Hit/miss/eviction counters of the address pattern match cache.
+        """
+        return self._match_cache.stats
 
     def send(
         self,
@@ -93,49 +180,184 @@ class Dispatcher:
         params: list[ArgValue],
         include_base_address: bool = False,
     ) -> None:
+        self.send_many(
+            address=address,
+            remote_addrs=[remote_addr],
+            params=params,
+            include_base_address=include_base_address,
+        )
+
+    def send_many(
+        self,
+        *,
+        address: str,
+        remote_addrs: list[tuple[str, int]],
+        params: list[ArgValue],
+        include_base_address: bool = False,
+    ) -> None:
+        """
+        Send the same message to several remote addresses, the message is encoded only once.
+        """
+        if inspect.isawaitable(params):
+            # params computed by an async handler (e.g. from a listener callback)
+            self._send_when_done(
+                address=address,
+                result=params,
+                remote_addrs=remote_addrs,
+                include_base_address=include_base_address,
+            )
+            return
         if self._server:
             if include_base_address:
                 address = f"{self._base_address}{address}"
-            self._server.send(address=address, params=params, remote_addr=remote_addr)
+            if len(remote_addrs) == 1:
+                self._server.send(address=address, params=params, remote_addr=remote_addrs[0])
+            else:
+                self._server.send_many(address=address, params=params, remote_addrs=remote_addrs)
         else:
-            self._logger.error(f"Trying to send OSC message to remote address {remote_addr}, but not server is set up")
+            self._logger.error(f"Trying to send OSC message to remote address {remote_addrs}, but not server is set up")
+
+    def _send_when_done(
+        self,
+        *,
+        address: str,
+        result: Awaitable[list[ArgValue]],
+        remote_addrs: list[tuple[str, int]],
+        include_base_address: bool = False,
+    ) -> None:
+        """
+        Run the result of an async handler as a task on the running event loop, and send its return value.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            self._logger.error(f"Handler for {address} is async, but no event loop is running")
+            if inspect.iscoroutine(result):
+                result.close()
+            return
+
+        def done(task: asyncio.Future) -> None:
+            self._tasks.discard(task)
+            if task.cancelled():
+                return
+            exc = task.exception()
+            if exc is not None:
+                self._logger.error(f"Error in async OSC handler for {address}: {exc!r}")
+                return
+            rv = task.result()
+            if rv is not None and rv != [None]:
+                assert isinstance(rv, list)
+                self.send_many(
+                    address=address,
+                    params=rv,
+                    remote_addrs=remote_addrs,
+                    include_base_address=include_base_address,
+                )
+
+        task = asyncio.ensure_future(result)
+        # the event loop only keeps weak references to tasks, keep it alive until it is done
+        self._tasks.add(task)
+        task.add_done_callback(done)
+
+    def match_handlers(
+        self,
+        address_pattern: str,
+    ) -> list[tuple[str, Callable[[list[ArgValue], tuple[str, int]], list[ArgValue]]]]:
+        """
+        Resolve an OSC address pattern against the registered handlers.
+        Results are cached per pattern until the route table changes, so the returned list must not be mutated.
+
+        Args:
+            address_pattern: OSC 1.0 address pattern, may contain `*`, `?`, `[]` and `{}`
+
+        Returns:
+            list of (callback_address, callback) pairs in registration order
+        """
+        matches = self._match_cache.get(address_pattern)
+        if matches is None:
+            matches = [(address, self._callbacks[address]) for address in self._address_index.match(address_pattern)]
+            self._match_cache.put(address_pattern, matches)
+        return matches
 
     def process_message(self, *, message: OscMessage, remote_addr: tuple[str, int]) -> None:
+        if self._executor is None or self._runs_inline(message.address):
+            self._process_message(message=message, remote_addr=remote_addr)
+        elif not self._executor.submit(
+            remote_addr,
+            message.address,
+            lambda: self._process_message(message=message, remote_addr=remote_addr),
+        ):
+            self._logger.warning(f"Dispatch queue is full, dropping OSC message {message.address} from {remote_addr}")
+
+    def _runs_inline(self, address: str) -> bool:
+        """
+        Whether a message has to be handled on the receiving thread, a pattern is when it matches any inline handler.
+        """
+        if not self._inline_addresses:
+            return False
+        if address in self._inline_addresses:
+            return True
+        return is_pattern(address) and any(a in self._inline_addresses for a, _ in self.match_handlers(address))
+
+    def _process_message(self, *, message: OscMessage, remote_addr: tuple[str, int]) -> None:
         if message.address in self._callbacks:
             callback = self._callbacks[message.address]
             rv = callback(message.params, remote_addr)
-            if rv:
+            if inspect.isawaitable(rv):
+                self._send_when_done(address=message.address, result=rv, remote_addrs=[remote_addr])
+            elif rv:
                 assert isinstance(rv, list)
                 if rv != [None]:
                     self.send(address=message.address, params=rv, remote_addr=remote_addr)
-        elif "*" in message.address:
-            regex = message.address.replace("*", "[^/]+")
-            for callback_address, callback in self._callbacks.items():
-                if re.match(regex, callback_address):
-                    try:
-                        rv = callback(message.params, remote_addr)
-                    except ValueError:
-                        # --------------------------------------------------------------------------------
-                        # Don't throw errors for queries that require more arguments
-                        # (e.g. /live/track/get/send with no args)
-                        # --------------------------------------------------------------------------------
-                        continue
-                    except AttributeError:
-                        # --------------------------------------------------------------------------------
-                        # Don't throw errors when trying to create listeners for properties that can't
-                        # be listened for (e.g. can_be_armed, is_foldable)
-                        # --------------------------------------------------------------------------------
-                        continue
-                    if rv is not None:
-                        assert isinstance(rv, list)
-                        self.send(address=callback_address, params=rv, remote_addr=remote_addr)
+        elif is_pattern(message.address):
+            self._process_pattern_message(message=message, remote_addr=remote_addr)
         else:
             self._logger.error(f"Unknown OSC address: {message.address}")
             # todo: return the error to the socket that sent it
 
+    def _process_pattern_message(self, *, message: OscMessage, remote_addr: tuple[str, int]) -> None:
+        matches = self.match_handlers(message.address)
+        if not matches:
+            self._logger.error(f"Unknown OSC address: {message.address}")
+            return
+        # Arguments are only decoded once a route was found.
+        params = message.params
+        for callback_address, callback in matches:
+            try:
+                rv = callback(params, remote_addr)
+            except ValueError:
+                # --------------------------------------------------------------------------------
+                # Don't throw errors for queries that require more arguments
+                # (e.g. /live/track/get/send with no args)
+                # --------------------------------------------------------------------------------
+                continue
+            except AttributeError:
+                # --------------------------------------------------------------------------------
+                # Don't throw errors when trying to create listeners for properties that can't
+                # be listened for (e.g. can_be_armed, is_foldable)
+                # --------------------------------------------------------------------------------
+                continue
+            if inspect.isawaitable(rv):
+                self._send_when_done(address=callback_address, result=rv, remote_addrs=[remote_addr])
+            elif rv is not None:
+                assert isinstance(rv, list)
+                self.send(address=callback_address, params=rv, remote_addr=remote_addr)
+
     def process_bundle(self, *, bundle: OscBundle, remote_addr: tuple[str, int]) -> None:
-        for i in bundle:
-            if OscBundle.dgram_is_bundle(i.dgram):
-                self.process_bundle(bundle=i, remote_addr=remote_addr)
-            else:
-                self.process_message(message=i, remote_addr=remote_addr)
+        if self._scheduler is not None:
+            timetag = bundle.timetag.ntp
+            if timetag > ntp.IMMEDIATELY_TIMETAG and timetag > ntp.ntp_timetag_now():
+                self._scheduler.schedule(timetag, lambda: self._dispatch_bundle(bundle=bundle, remote_addr=remote_addr))
+                return
+        self._dispatch_bundle(bundle=bundle, remote_addr=remote_addr)
+
+    def _dispatch_bundle(self, *, bundle: OscBundle, remote_addr: tuple[str, int]) -> None:
+        # elements are parsed one by one while iterating, a malformed element stops the rest of the bundle
+        try:
+            for i in bundle:
+                if isinstance(i, OscBundle):
+                    self.process_bundle(bundle=i, remote_addr=remote_addr)
+                else:
+                    self.process_message(message=i, remote_addr=remote_addr)
+        except BundleParseError as e:
+            self._logger.error(f"Malformed OSC bundle from {remote_addr}, skipping the remaining elements: {e}")
@@ -0,0 +1,127 @@
+"""Segment trie over registered OSC addresses, used to resolve OSC 1.0 address patterns."""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Pattern
+
+# Characters that make an address segment a pattern rather than a literal (OSC 1.0 spec).
+PATTERN_CHARS = frozenset("*?[]{}")
+
+
+def is_pattern(address: str) -> bool:
+    """Returns whether the address contains any OSC pattern-matching characters."""
+    return not PATTERN_CHARS.isdisjoint(address)
+
+
+@lru_cache(maxsize=1024)
+def compile_segment(segment: str) -> Pattern[str]:
+    """Translate a single OSC address pattern segment into a compiled regular expression.
+
+    Supports `*`, `?`, `[a-z]`, `[!a-z]` and `{foo,bar}` as described in the OSC 1.0 specification.
+    Segments never contain `/`, so `*` and `?` are free to match any character.
+    """
+    regex = ""
+    i = 0
+    n = len(segment)
+    while i < n:
+        c = segment[i]
+        if c == "*":
+            regex += ".*"
+        elif c == "?":
+            regex += "."
+        elif c == "[":
+            end = segment.find("]", i + 1)
+            if end == -1:
+                regex += re.escape(c)
+            else:
+                body = segment[i + 1 : end]
+                negate = body.startswith("!")
+                if negate:
+                    body = body[1:]
+                body = body.replace("\\", "\\\\").replace("^", "\\^").replace("[", "\\[")
+                regex += f"[{'^' if negate else ''}{body}]"
+                i = end
+        elif c == "{":
+            end = segment.find("}", i + 1)
+            if end == -1:
+                regex += re.escape(c)
+            else:
+                options = segment[i + 1 : end].split(",")
+                regex += f"(?:{'|'.join(re.escape(o) for o in options)})"
+                i = end
+        else:
+            regex += re.escape(c)
+        i += 1
+    return re.compile(regex, re.DOTALL)
+
+
+class _Node:
+    __slots__ = ("address", "children", "order")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.address: str | None = None
+        self.order = 0
+
+
+class AddressIndex:
+    """Index of registered OSC addresses, split into a trie of address segments.
+
+    Literal segments of a pattern are resolved with a dict lookup, and pattern segments are only
+    matched against the children of the node reached so far, so resolving a pattern costs time
+    proportional to the pattern and the fan-out of the matched nodes, not the total route count.
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._count = 0
+
+    def add(self, address: str) -> None:
+        """Register an address. Re-adding an existing address keeps its original order."""
+        node = self._root
+        for segment in address.split("/")[1:]:
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _Node()
+            node = child
+        if node.address is None:
+            node.address = address
+            node.order = self._count
+            self._count += 1
+
+    def clear(self) -> None:
+        """Remove all registered addresses."""
+        self._root = _Node()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def match(self, pattern: str) -> list[str]:
+        """Returns all registered addresses matched by the OSC address pattern, in registration order.
+
+        A malformed pattern (e.g. an empty or inverted `[]` range) matches nothing.
+        """
+        nodes = [self._root]
+        for segment in pattern.split("/")[1:]:
+            matched: list[_Node] = []
+            if is_pattern(segment):
+                try:
+                    regex = compile_segment(segment)
+                except re.error:
+                    return []
+                for node in nodes:
+                    matched.extend(child for name, child in node.children.items() if regex.fullmatch(name))
+            else:
+                for node in nodes:
+                    child = node.children.get(segment)
+                    if child is not None:
+                        matched.append(child)
+            if not matched:
+                return []
+            nodes = matched
+        if len(nodes) > 1:
+            nodes.sort(key=lambda node: node.order)
+        return [node.address for node in nodes if node.address is not None]
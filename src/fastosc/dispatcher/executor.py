@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Hashable
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_PENDING = 10000
+
+
+@dataclass
+class HandlerStats:
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    @property
+    def avg_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+
+class OrderedExecutor:
+    """
+    Runs dispatch jobs on a bounded thread pool, while jobs submitted with the same key (the remote address
+    of the client) run one after the other in submission order.
+
+    Each key with queued jobs occupies at most one worker thread, so a slow handler only delays the client
+    that called it. Jobs are rejected once max_pending jobs are queued or running.
+    """
+
+    def __init__(
+        self,
+        *,
+        logger: logging.Logger,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        self._logger = logger
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fastosc-dispatch")
+        self._max_pending = max_pending
+        self._lock = threading.Lock()
+        self._queues: dict[Hashable, deque[tuple[str, Callable[[], None]]]] = {}
+        self._pending = 0
+        self._rejected = 0
+        self._stats: dict[str, HandlerStats] = {}
+
+    def submit(self, key: Hashable, label: str, job: Callable[[], None]) -> bool:
+        """
+        Queue a job behind any other job with the same key.
+
+        Args:
+            key: jobs with the same key never run concurrently and keep their order
+            label: name under which the job's runtime is recorded (the OSC address)
+            job: the callable to run
+
+        Returns:
+            False if the job was rejected because the executor is full
+        """
+        with self._lock:
+            if self._pending >= self._max_pending:
+                self._rejected += 1
+                return False
+            self._pending += 1
+            queue = self._queues.get(key)
+            if queue is not None:
+                queue.append((label, job))
+                return True
+            self._queues[key] = deque([(label, job)])
+        self._pool.submit(self._drain, key)
+        return True
+
+    def _drain(self, key: Hashable) -> None:
+        while True:
+            with self._lock:
+                queue = self._queues[key]
+                if not queue:
+                    del self._queues[key]
+                    return
+                label, job = queue.popleft()
+            start = time.perf_counter()
+            try:
+                job()
+            except Exception as e:  # noqa
+                self._logger.error(f"Error handling OSC message: {e}")
+                self._logger.warning(f"{traceback.format_exc()}")
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self._pending -= 1
+                stats = self._stats.get(label)
+                if stats is None:
+                    stats = self._stats[label] = HandlerStats()
+                stats.calls += 1
+                stats.total_time += elapsed
+                stats.max_time = max(stats.max_time, elapsed)
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs queued or running."""
+        return self._pending
+
+    @property
+    def rejected(self) -> int:
+        """Number of jobs rejected because the executor was full."""
+        return self._rejected
+
+    @property
+    def handler_stats(self) -> dict[str, HandlerStats]:
+        """Snapshot of the runtime statistics per label."""
+        with self._lock:
+            return {
+                label: HandlerStats(calls=s.calls, total_time=s.total_time, max_time=s.max_time)
+                for label, s in self._stats.items()
+            }
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+import traceback
+from typing import Callable
+
+from fastosc.message.parsing import ntp
+
+DEFAULT_MAX_PENDING = 10000
+# The timer thread sleeps until this close to a deadline, then spins for the rest.
+DEFAULT_SPIN_TIME = 0.001
+
+_NTP_UNITS_PER_SECOND = 2**32
+
+
+class BundleScheduler:
+    """
+    Holds jobs (the dispatch of future-dated bundles) in a min-heap keyed by their raw NTP time tag, and runs
+    them once that time has come.
+
+    Due jobs are run by release_due(), which the dispatcher calls on every tick (so from the server's
+    process() calls), or by a timer thread started with start(), which sleeps until shortly before the next
+    deadline and spins for the rest, for sub millisecond accuracy. Jobs run on the releasing thread.
+    Jobs are rejected once max_pending jobs are waiting.
+    """
+
+    def __init__(
+        self,
+        *,
+        logger: logging.Logger,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        spin_time: float = DEFAULT_SPIN_TIME,
+    ) -> None:
+        self._logger = logger
+        self._max_pending = max_pending
+        self._spin_time = spin_time
+        self._heap: list[tuple[int, int, Callable[[], None]]] = []
+        # tie breaker, keeps jobs with the same time tag in scheduling order
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._rejected = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs waiting for their time."""
+        return len(self._heap)
+
+    @property
+    def rejected(self) -> int:
+        """Number of jobs rejected because max_pending jobs were waiting."""
+        return self._rejected
+
+    def next_due(self) -> int | None:
+        """Time tag of the next job, None if nothing is scheduled."""
+        with self._condition:
+            return self._heap[0][0] if self._heap else None
+
+    def schedule(self, timetag: int, job: Callable[[], None]) -> bool:
+        """
+        Queue a job to run at the given time.
+
+        Args:
+            timetag: raw 64-bit NTP time tag
+            job: the callable to run
+
+        Returns:
+            False if the job was rejected
+        """
+        with self._condition:
+            if len(self._heap) >= self._max_pending:
+                self._rejected += 1
+                self._logger.warning(f"Scheduler full ({self._max_pending} pending), dropping scheduled bundle")
+                return False
+            heapq.heappush(self._heap, (timetag, next(self._sequence), job))
+            if self._heap[0][0] == timetag:
+                # new earliest deadline, wake up the timer thread
+                self._condition.notify()
+        return True
+
+    def release_due(self, now: int | None = None) -> int:
+        """
+        Run all jobs whose time has come, in time order.
+
+        Args:
+            now: raw NTP time tag to compare with, defaults to the current time
+
+        Returns:
+            number of jobs run
+        """
+        if not self._heap:
+            return 0
+        if now is None:
+            now = ntp.ntp_timetag_now()
+        due: list[Callable[[], None]] = []
+        with self._condition:
+            heap = self._heap
+            while heap and heap[0][0] <= now:
+                due.append(heapq.heappop(heap)[2])
+        for job in due:
+            try:
+                job()
+            except Exception as e:  # noqa
+                self._logger.error(f"Error in scheduled OSC bundle: {e}")
+                self._logger.warning(f"{traceback.format_exc()}")
+        return len(due)
+
+    def start(self) -> None:
+        """
+        Release jobs from a timer thread, instead of relying on ticks only.
+        """
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name="fastosc-scheduler", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                if not self._heap:
+                    self._condition.wait()
+                    continue
+                delay = (self._heap[0][0] - ntp.ntp_timetag_now()) / _NTP_UNITS_PER_SECOND
+                if delay > self._spin_time:
+                    self._condition.wait(delay - self._spin_time)
+                    continue
+            # close to the deadline, spin outside of the lock so other threads can still schedule
+            deadline = time.perf_counter() + delay
+            while time.perf_counter() < deadline:
+                pass
+            self.release_due()
+
+    def shutdown(self, *, run_pending: bool = False) -> None:
+        """
+        Stop the timer thread and drop the waiting jobs, or run them right away with run_pending.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join()
+        if run_pending:
+            self.release_due(now=2**64)
+        with self._condition:
+            self._heap = []
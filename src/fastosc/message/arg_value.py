@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Any, List, Union
 
 from fastosc.message.parsing import osc_types
+from fastosc.message.parsing.ntp import TimeTag
 
 ArgValue = Union[
     None,
@@ -15,6 +16,7 @@ ArgValue = Union[
     tuple,
     datetime,
     osc_types.MidiPacket,
+    TimeTag,
     List[
         Union[
             None,
@@ -26,6 +28,7 @@ ArgValue = Union[
             tuple,
             datetime,
             osc_types.MidiPacket,
+            TimeTag,
             List[
                 Union[
                     None,
@@ -37,6 +40,7 @@ ArgValue = Union[
                     tuple,
                     datetime,
                     osc_types.MidiPacket,
+                    TimeTag,
                     List[
                         Union[
                             None,
@@ -48,6 +52,7 @@ ArgValue = Union[
                             tuple,
                             datetime,
                             osc_types.MidiPacket,
+                            TimeTag,
                             List[
                                 Union[
                                     None,
@@ -59,6 +64,7 @@ ArgValue = Union[
                                     tuple,
                                     datetime,
                                     osc_types.MidiPacket,
+                                    TimeTag,
                                     List[
                                         Union[
                                             None,
@@ -70,6 +76,7 @@ ArgValue = Union[
                                             tuple,
                                             datetime,
                                             osc_types.MidiPacket,
+                                            TimeTag,
                                             List[
                                                 Union[
                                                     None,
@@ -81,6 +88,7 @@ ArgValue = Union[
                                                     tuple,
                                                     datetime,
                                                     osc_types.MidiPacket,
+                                                    TimeTag,
                                                     List[
                                                         Union[
                                                             None,
@@ -92,6 +100,7 @@ ArgValue = Union[
                                                             tuple,
                                                             datetime,
                                                             osc_types.MidiPacket,
+                                                            TimeTag,
                                                             List[
                                                                 Union[
                                                                     None,
@@ -103,6 +112,7 @@ ArgValue = Union[
                                                                     tuple,
                                                                     datetime,
                                                                     osc_types.MidiPacket,
+                                                                    TimeTag,
                                                                     List[
                                                                         Union[
                                                                             None,
@@ -114,6 +124,7 @@ ArgValue = Union[
                                                                             tuple,
                                                                             datetime,
                                                                             osc_types.MidiPacket,
+                                                                            TimeTag,
                                                                             List[
                                                                                 Union[
                                                                                     None,
@@ -125,6 +136,7 @@ ArgValue = Union[
                                                                                     tuple,
                                                                                     datetime,
                                                                                     osc_types.MidiPacket,
+                                                                                    TimeTag,
                                                                                     List[
                                                                                         Union[
                                                                                             None,
@@ -136,6 +148,7 @@ ArgValue = Union[
                                                                                             tuple,
                                                                                             datetime,
                                                                                             osc_types.MidiPacket,
+                                                                                            TimeTag,
                                                                                             List[Any],
                                                                                         ]
                                                                                     ],
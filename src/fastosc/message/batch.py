@@ -0,0 +1,115 @@
+"""Coalescing of outgoing messages into bundles per destination."""
+
+from __future__ import annotations
+
+import time
+from typing import Hashable, Tuple
+
+from fastosc.message import osc_bundle_builder
+
+# Conservative UDP payload size that avoids IP fragmentation on ethernet.
+DEFAULT_MTU = 1400
+
+# "#bundle\0" + timetag, then an int32 size before every element.
+_BUNDLE_HEADER_SIZE = 16
+_ELEMENT_HEADER_SIZE = 4
+
+RemoteAddr = Tuple[str, int]
+
+
+class _PendingBatch:
+    __slots__ = ("messages", "since", "size")
+
+    def __init__(self) -> None:
+        # keyed by address when deduplicating, by insertion count otherwise
+        self.messages: dict[Hashable, bytes] = {}
+        self.size = _BUNDLE_HEADER_SIZE
+        self.since = time.monotonic()
+
+
+class MessageBatcher:
+    """Queues encoded messages per destination and packs them into bundles of at most mtu bytes.
+
+    A batch holding a single message is sent as the plain message, and a message that does not fit in an
+    mtu sized bundle on its own is sent as is.
+
+    With dedupe, a message queued for an address that already has a queued message to the same destination
+    replaces it in place, so only the latest value is sent. The address alone is the key, whatever the args, so
+    this only suits addresses that carry a single value per destination (a message that does not fit in place
+    any more is queued at the end of the next batch instead).
+    """
+
+    def __init__(self, *, mtu: int = DEFAULT_MTU, dedupe: bool = False) -> None:
+        self._mtu = mtu
+        self._dedupe = dedupe
+        self._count = 0
+        self._pending: dict[RemoteAddr, _PendingBatch] = {}
+
+    def add(self, remote_addr: RemoteAddr, dgram: bytes, address: str | None = None) -> list[bytes]:
+        """Queue a message for a destination.
+
+        Args:
+          remote_addr: the destination.
+          dgram: the encoded message.
+          address: the message address, used to replace superseded messages when deduplicating.
+
+        Returns:
+          datagrams that have to be sent right away because the message did not fit in the pending batch.
+        """
+        ready: list[bytes] = []
+        element_size = _ELEMENT_HEADER_SIZE + len(dgram)
+        batch = self._pending.get(remote_addr)
+        key: Hashable = address
+        if self._dedupe and address is not None:
+            if batch is not None and address in batch.messages:
+                size = batch.size - len(batch.messages[address]) + len(dgram)
+                if size <= self._mtu:
+                    # assigning to an existing key keeps its slot in the bundle
+                    batch.messages[address] = dgram
+                    batch.size = size
+                    return ready
+                batch.size -= _ELEMENT_HEADER_SIZE + len(batch.messages.pop(address))
+        else:
+            self._count += 1
+            key = self._count
+        if _BUNDLE_HEADER_SIZE + element_size > self._mtu:
+            ready.extend(self.flush(remote_addr))
+            ready.append(dgram)
+            return ready
+        if batch is not None and batch.size + element_size > self._mtu:
+            ready.extend(self.flush(remote_addr))
+            batch = None
+        if batch is None:
+            batch = self._pending[remote_addr] = _PendingBatch()
+        batch.messages[key] = dgram
+        batch.size += element_size
+        return ready
+
+    def flush(self, remote_addr: RemoteAddr) -> list[bytes]:
+        """Returns the datagrams for everything queued for a destination and clears its queue."""
+        batch = self._pending.pop(remote_addr, None)
+        if batch is None or not batch.messages:
+            return []
+        if len(batch.messages) == 1:
+            return list(batch.messages.values())
+        builder = osc_bundle_builder.OscBundleBuilder(osc_bundle_builder.IMMEDIATELY)
+        for dgram in batch.messages.values():
+            builder.add_dgram(dgram)
+        return [builder.build_dgram()]
+
+    def flush_all(self) -> list[tuple[RemoteAddr, bytes]]:
+        """Returns the (destination, datagram) pairs for everything queued and clears all queues."""
+        return [(remote_addr, dgram) for remote_addr in list(self._pending) for dgram in self.flush(remote_addr)]
+
+    def due(self, max_delay: float) -> list[RemoteAddr]:
+        """Returns the destinations whose oldest queued message has waited at least max_delay seconds."""
+        deadline = time.monotonic() - max_delay
+        return [remote_addr for remote_addr, batch in self._pending.items() if batch.since <= deadline]
+
+    def pending_size(self, remote_addr: RemoteAddr) -> int:
+        """Returns the size in bytes of the bundle that would be sent for a destination (0 if nothing is queued)."""
+        batch = self._pending.get(remote_addr)
+        return batch.size if batch is not None else 0
+
+    def __len__(self) -> int:
+        return sum(len(batch.messages) for batch in self._pending.values())
@@ -1,15 +1,58 @@
+# ruff: noqa: B904,PLR2004
 from __future__ import annotations
 
-from fastosc.message.arg_value import ArgValue
+from fastosc.message.arg_value import (
+    ARG_TYPE_FALSE,
+    ARG_TYPE_FLOAT,
+    ARG_TYPE_INT,
+    ARG_TYPE_INT64,
+    ARG_TYPE_NIL,
+    ARG_TYPE_STRING,
+    ARG_TYPE_TRUE,
+    ArgValue,
+)
 from fastosc.message.osc_message_builder import BuildError, OscMessageBuilder
+from fastosc.message.parsing import encoder, osc_types
 
 
-def convert_message(*, address: str, params: list[ArgValue]) -> bytes:
+def _convert_with_builder(*, address: str, params: list[ArgValue]) -> bytes:
     msg_builder = OscMessageBuilder(address)
-    for param in params or []:
+    for param in params:
         msg_builder.add_arg(param)
+    return msg_builder.build_dgram()
+
+
+def convert_message(*, address: str, params: list[ArgValue]) -> bytes:
+    """Encode an address and its parameters into an OSC message datagram.
+
+    Flat scalar parameters (str, int, float, bool, None) have their types inferred and are encoded
+    directly, anything else (arrays, MIDI tuples, blobs, timetags) goes through OscMessageBuilder.
+
+    Raises:
+      - BuildError: if the message could not be built.
+    """
+    if not params:
+        params = []
+    arg_types = []
+    for param in params:
+        param_type = type(param)
+        if param_type is str:
+            arg_types.append(ARG_TYPE_STRING)
+        elif param_type is float:
+            arg_types.append(ARG_TYPE_FLOAT)
+        elif param_type is int:
+            arg_types.append(ARG_TYPE_INT64 if param.bit_length() > 32 else ARG_TYPE_INT)  # type: ignore[union-attr]
+        elif param is True:
+            arg_types.append(ARG_TYPE_TRUE)
+        elif param is False:
+            arg_types.append(ARG_TYPE_FALSE)
+        elif param is None:
+            arg_types.append(ARG_TYPE_NIL)
+        else:
+            return _convert_with_builder(address=address, params=params)
+    if not address:
+        raise BuildError("OSC addresses cannot be empty")
     try:
-        msg = msg_builder.build()
-        return msg.dgram
-    except BuildError as e:
-        raise e
+        return encoder.encode_message(address, "".join(arg_types), params)
+    except osc_types.BuildError as be:
+        raise BuildError(f"Could not build the message: {be}")
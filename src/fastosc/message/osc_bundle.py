@@ -5,9 +5,9 @@ import logging
 from typing import Any, Iterator
 
 from fastosc.message import osc_message
-from fastosc.message.parsing import osc_types
+from fastosc.message.parsing import ntp, osc_types
 
-_BUNDLE_PREFIX = b"#bundle\x00"
+BUNDLE_PREFIX = b"#bundle\x00"
 
 
 class ParseError(Exception):
@@ -18,68 +18,87 @@ class OscBundle:
     """Bundles elements that should be triggered at the same time.
 
     An element can be another OscBundle or an OscMessage.
+
+    Only the bundle header is parsed up front. Elements are read when iterating, as views into the bundle's
+    datagram (no copies), and nested bundles are only parsed once they are reached.
     """
 
-    def __init__(self, dgram: bytes) -> None:
+    def __init__(self, dgram: osc_types.Buffer) -> None:
         """Initializes the OscBundle with the given datagram.
 
         Args:
           dgram: a UDP datagram representing an OscBundle.
 
         Raises:
-          ParseError: if the datagram could not be parsed into an OscBundle.
+          ParseError: if the datagram header could not be parsed. Errors in the elements are raised when
+            they are reached.
         """
         # Interesting stuff starts after the initial b"#bundle\x00".
         self._dgram = dgram
-        index = len(_BUNDLE_PREFIX)
+        index = len(BUNDLE_PREFIX)
         try:
             self._timestamp, index = osc_types.get_date(self._dgram, index)
         except osc_types.ParseError as pe:
             raise ParseError(f"Could not get the date from the datagram: {pe}")
-        # Get the contents as a list of OscBundle and OscMessage.
-        self._contents = self._parse_contents(index)
-
-    def _parse_contents(self, index: int) -> list[OscBundle | osc_message.OscMessage]:
-        contents = []  # type: list[OscBundle | osc_message.OscMessage]
-
+        self._contents_index = index
+        # (start, end) of every element, filled on the first random access
+        self._offsets: list[tuple[int, int]] | None = None
+
+    def _iter_offsets(self) -> Iterator[tuple[int, int]]:
+        # An OSC Bundle Element consists of its size and its contents.
+        # The size is an int32 representing the number of 8-bit bytes in the
+        # contents, and will always be a multiple of 4. The contents are either
+        # an OSC Message or an OSC Bundle.
+        dgram = self._dgram
+        end = len(dgram)
+        index = self._contents_index
+        while index < end:
+            try:
+                content_size, index = osc_types.get_int(dgram, index)
+            except osc_types.ParseError as pe:
+                raise ParseError(f"Could not parse a content datagram: {pe}")
+            if content_size < 0 or index + content_size > end:
+                raise ParseError(f"Content size {content_size} at index {index} exceeds the datagram")
+            yield index, index + content_size
+            index += content_size
+
+    def _content_offsets(self) -> list[tuple[int, int]]:
+        if self._offsets is None:
+            self._offsets = list(self._iter_offsets())
+        return self._offsets
+
+    def _parse_content(self, view: memoryview, start: int, end: int) -> OscBundle | osc_message.OscMessage | None:
+        content_dgram = view[start:end]
         try:
-            # An OSC Bundle Element consists of its size and its contents.
-            # The size is an int32 representing the number of 8-bit bytes in the
-            # contents, and will always be a multiple of 4. The contents are either
-            # an OSC Message or an OSC Bundle.
-            while self._dgram[index:]:
-                # Get the sub content size.
-                content_size, index = osc_types.get_int(self._dgram, index)
-                # Get the datagram for the sub content.
-                content_dgram = self._dgram[index : index + content_size]
-                # Increment our position index up to the next possible content.
-                index += content_size
-                # Parse the content into an OSC message or bundle.
-                if OscBundle.dgram_is_bundle(content_dgram):
-                    contents.append(OscBundle(content_dgram))
-                elif osc_message.OscMessage.dgram_is_message(content_dgram):
-                    contents.append(osc_message.OscMessage(content_dgram))
-                else:
-                    logging.warning(f"Could not identify content type of dgram {content_dgram!r}")
-        except (osc_types.ParseError, osc_message.ParseError, IndexError) as e:
+            if OscBundle.dgram_is_bundle(content_dgram):
+                return OscBundle(content_dgram)
+            if osc_message.OscMessage.dgram_is_message(content_dgram):
+                return osc_message.OscMessage(content_dgram, lazy=True)
+        except osc_message.ParseError as e:
             raise ParseError(f"Could not parse a content datagram: {e}")
-
-        return contents
+        logging.warning(f"Could not identify content type of dgram {bytes(content_dgram)!r}")
+        return None
 
     @staticmethod
-    def dgram_is_bundle(dgram: bytes) -> bool:
+    def dgram_is_bundle(dgram: osc_types.Buffer) -> bool:
         """Returns whether this datagram starts like an OSC bundle."""
-        return dgram.startswith(_BUNDLE_PREFIX)
+        return dgram[: len(BUNDLE_PREFIX)] == BUNDLE_PREFIX
 
     @property
     def timestamp(self) -> float:
         """Returns the timestamp associated with this bundle."""
         return self._timestamp
 
+    @property
+    def timetag(self) -> ntp.TimeTag:
+        """Returns the raw time tag of this bundle, without the float conversion of timestamp."""
+        timetag, _ = osc_types.get_uint64(self._dgram, len(BUNDLE_PREFIX))
+        return ntp.TimeTag(timetag)
+
     @property
     def num_contents(self) -> int:
         """Shortcut for len(*bundle) returning the number of elements."""
-        return len(self._contents)
+        return len(self._content_offsets())
 
     @property
     def size(self) -> int:
@@ -87,14 +106,24 @@ class OscBundle:
         return len(self._dgram)
 
     @property
-    def dgram(self) -> bytes:
+    def dgram(self) -> osc_types.Buffer:
         """Returns the datagram from which this bundle was built."""
         return self._dgram
 
     def content(self, index: int) -> Any:
         """Returns the bundle's content 0-indexed."""
-        return self._contents[index]
+        start, end = self._content_offsets()[index]
+        return self._parse_content(memoryview(self._dgram), start, end)
 
     def __iter__(self) -> Iterator[Any]:
-        """Returns an iterator over the bundle's content."""
-        return iter(self._contents)
+        """Returns an iterator over the bundle's content, parsing every element when it is reached.
+
+        Raises:
+          ParseError: when reaching an element that could not be parsed.
+        """
+        view = memoryview(self._dgram)
+        offsets = self._offsets if self._offsets is not None else self._iter_offsets()
+        for start, end in offsets:
+            content = self._parse_content(view, start, end)
+            if content is not None:
+                yield content
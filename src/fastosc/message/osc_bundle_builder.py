@@ -3,9 +3,14 @@
 
 from __future__ import annotations
 
+import struct
+
 from fastosc.message import osc_bundle, osc_message
+from fastosc.message.osc_bundle import BUNDLE_PREFIX
 from fastosc.message.parsing import osc_types
 
+_INT = struct.Struct(">i")
+
 # Shortcut to specify an immediate execution of messages in the bundle.
 IMMEDIATELY = osc_types.IMMEDIATELY
 
@@ -15,25 +20,97 @@ class BuildError(Exception):
 
 
 class OscBundleBuilder:
-    """Builds arbitrary OscBundle instances."""
+    """Builds arbitrary OscBundle instances.
+
+    Elements are encoded into a growing buffer as they are added. With an mtu, a new bundle (with the same
+    timestamp) is started whenever the next element would make the current one larger than mtu bytes, and
+    build_dgrams() returns all of them.
+    """
 
-    def __init__(self, timestamp: int) -> None:
+    def __init__(self, timestamp: int, *, mtu: int | None = None) -> None:
         """Build a new bundle with the associated timestamp.
 
         Args:
           - timestamp: system time represented as a floating point number of
                        seconds since the epoch in UTC or IMMEDIATELY.
+          - mtu: max size in bytes of a bundle, an element that does not fit in
+                 an empty bundle gets a bundle of its own. Unlimited if None.
         """
         self._timestamp = timestamp
-        self._contents = []  # type: list[osc_bundle.OscBundle]
+        self._mtu = mtu
+        self._header: bytes | None = None
+        self._done: list[bytes] = []
+        self._buffer: bytearray | None = None
+        self._count = 0
+
+    def _new_buffer(self) -> bytearray:
+        if self._header is None:
+            try:
+                self._header = BUNDLE_PREFIX + osc_types.write_date(self._timestamp)
+            except osc_types.BuildError as be:
+                raise BuildError(f"Could not build the bundle {be}")
+        self._count = 0
+        return bytearray(self._header)
 
     def add_content(self, content: osc_bundle.OscBundle) -> None:
         """Add a new content to this bundle.
 
         Args:
           - content: Either an OscBundle or an OscMessage
+
+        Raises:
+          - BuildError: if the content is neither.
+        """
+        if not isinstance(content, (osc_message.OscMessage, osc_bundle.OscBundle)):
+            raise BuildError("Content must be either OscBundle or OscMessage" f"found {type(content)}")
+        self.add_dgram(content.dgram)
+
+    def add_dgram(self, dgram: osc_types.Buffer) -> None:
+        """Add an already encoded message or bundle to this bundle.
+
+        Args:
+          - dgram: the datagram of an OscMessage or OscBundle
+        """
+        buffer = self._buffer
+        if buffer is None:
+            buffer = self._buffer = self._new_buffer()
+        elif self._mtu is not None and self._count and len(buffer) + 4 + len(dgram) > self._mtu:
+            self._done.append(bytes(buffer))
+            buffer = self._buffer = self._new_buffer()
+        buffer += _INT.pack(len(dgram))
+        buffer += dgram
+        self._count += 1
+
+    @property
+    def size(self) -> int:
+        """Returns the size in bytes of the bundle currently being filled."""
+        if self._buffer is None:
+            return len(self._new_buffer())
+        return len(self._buffer)
+
+    @property
+    def num_bundles(self) -> int:
+        """Returns the number of bundles the contents take."""
+        return len(self._done) + 1
+
+    def build_dgrams(self) -> list[bytes]:
+        """Returns the datagrams of the bundles holding all contents, more than one only if an mtu is set.
+
+        Raises:
+          - BuildError: if we could not build the bundle.
+        """
+        current = self._buffer if self._buffer is not None else self._new_buffer()
+        return [*self._done, bytes(current)]
+
+    def build_dgram(self) -> bytes:
+        """Returns the datagram of the bundle with the current state of this builder.
+
+        Raises:
+          - BuildError: if we could not build the bundle, or the contents do not fit in a single bundle.
         """
-        self._contents.append(content)
+        if self._done:
+            raise BuildError(f"Contents do not fit in a single bundle of {self._mtu} bytes, use build_dgrams()")
+        return self.build_dgrams()[0]
 
     def build(self) -> osc_bundle.OscBundle:
         """Build an OscBundle with the current state of this builder.
@@ -41,16 +118,4 @@ class OscBundleBuilder:
         Raises:
           - BuildError: if we could not build the bundle.
         """
-        dgram = b"#bundle\x00"
-        try:
-            dgram += osc_types.write_date(self._timestamp)
-            for content in self._contents:
-                if type(content) == osc_message.OscMessage or type(content) == osc_bundle.OscBundle:
-                    size = content.size
-                    dgram += osc_types.write_int(size)
-                    dgram += content.dgram
-                else:
-                    raise BuildError("Content must be either OscBundle or OscMessage" f"found {type(content)}")
-            return osc_bundle.OscBundle(dgram)
-        except osc_types.BuildError as be:
-            raise BuildError(f"Could not build the bundle {be}")
+        return osc_bundle.OscBundle(self.build_dgram())
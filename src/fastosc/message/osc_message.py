@@ -1,13 +1,38 @@
 """Representation of an OSC message in a pythonesque way."""
-# ruff: noqa: B904,PLR0912,PLR0915,PLR2004
+# ruff: noqa: B904
 
 from __future__ import annotations
 
-import logging
 from typing import Iterator
 
+from fastosc.cache import CacheStats, LRUCache
 from fastosc.message.arg_value import ArgValue
-from fastosc.message.parsing import osc_types
+from fastosc.message.parsing import decoder, osc_types
+
+# Number of distinct addresses to keep decoded. A repeated address is the same str object while it is cached,
+# with its hash already computed for the dispatcher's handler lookup. Addresses come from the network, so they
+# are not interned (interned strings are never freed on some Python versions).
+ADDRESS_CACHE_SIZE = 1024
+
+_addresses: LRUCache[bytes, str] = LRUCache(ADDRESS_CACHE_SIZE)
+
+
+def address_cache_stats() -> CacheStats:
+    """Returns the hit/miss/eviction counters of the decoded address cache."""
+    return _addresses.stats
+
+
+def _get_address(dgram: osc_types.Buffer) -> tuple[str, int]:
+    str_end, index = osc_types.get_string_bounds(dgram, 0)
+    raw = bytes(dgram[:str_end])
+    address = _addresses.get(raw)
+    if address is None:
+        try:
+            address = str(raw, "utf-8")
+        except UnicodeDecodeError as e:
+            raise osc_types.ParseError(f"Could not decode address {e}")
+        _addresses.put(raw, address)
+    return address, index
 
 
 class ParseError(Exception):
@@ -21,71 +46,46 @@ class OscMessage:
     Type Tag String followed by zero or more OSC Arguments.
     """
 
-    def __init__(self, dgram: bytes) -> None:
+    def __init__(self, dgram: osc_types.Buffer, *, lazy: bool = False) -> None:
+        """Initializes the OscMessage with the given datagram.
+
+        Args:
+          dgram: bytes, or a bytearray / memoryview over a receive buffer. The buffer is parsed in place
+                 and kept as is, so it must not be modified while the message is in use.
+          lazy: only decode the address and type tag up front, the arguments are decoded on first access
+                (and parse errors in the arguments are raised from there).
+
+        Raises:
+          ParseError: if the datagram could not be parsed into an OscMessage.
+        """
         self._dgram = dgram
-        self._parameters: list[ArgValue] = []  #
+        self._type_tag = ""
+        self._args_index = 0
+        self._parameters: list[ArgValue] | None = None
         self._parse_datagram()
+        if not lazy:
+            self._parse_arguments()
 
     def _parse_datagram(self) -> None:
         try:
-            self._address_regexp, index = osc_types.get_string(self._dgram, 0)
-            if not self._dgram[index:]:
-                # No params is legit, just return now.
-                return
-
-            # Get the parameters types.
-            type_tag, index = osc_types.get_string(self._dgram, index)
-            if type_tag.startswith(","):
-                type_tag = type_tag[1:]
-
-            params: list[ArgValue] = []
-            param_stack = [params]
-            # Parse each parameter given its type.
-            for param in type_tag:
-                val = NotImplemented  # Any
-                if param == "i":  # Integer.
-                    val, index = osc_types.get_int(self._dgram, index)  # type: ignore
-                elif param == "h":  # Int64.
-                    val, index = osc_types.get_int64(self._dgram, index)  # type: ignore
-                elif param == "f":  # Float.
-                    val, index = osc_types.get_float(self._dgram, index)  # type: ignore
-                elif param == "d":  # Double.
-                    val, index = osc_types.get_double(self._dgram, index)  # type: ignore
-                elif param == "s":  # String.
-                    val, index = osc_types.get_string(self._dgram, index)  # type: ignore
-                elif param == "b":  # Blob.
-                    val, index = osc_types.get_blob(self._dgram, index)  # type: ignore
-                elif param == "r":  # RGBA.
-                    val, index = osc_types.get_rgba(self._dgram, index)  # type: ignore
-                elif param == "m":  # MIDI.
-                    val, index = osc_types.get_midi(self._dgram, index)  # type: ignore
-                elif param == "t":  # osc time tag:
-                    val, index = osc_types.get_timetag(self._dgram, index)  # type: ignore
-                elif param == "T":  # True.
-                    val = True  # type: ignore
-                elif param == "F":  # False.
-                    val = False  # type: ignore
-                elif param == "N":  # Nil.
-                    val = None  # type: ignore
-                elif param == "[":  # Array start.
-                    array: list[ArgValue] = []
-                    param_stack[-1].append(array)
-                    param_stack.append(array)
-                elif param == "]":  # Array stop.
-                    if len(param_stack) < 2:
-                        raise ParseError(f"Unexpected closing bracket in type tag: {type_tag}")
-                    param_stack.pop()
-                # TODO: Support more exotic types as described in the specification.
-                else:
-                    logging.warning(f"Unhandled parameter type: {param}")
-                    continue
-                if param not in "[]":
-                    param_stack[-1].append(val)
-            if len(param_stack) != 1:
-                raise ParseError(f"Missing closing bracket in type tag: {type_tag}")
-            self._parameters = params
+            self._address_regexp, index = _get_address(self._dgram)
+            # No params is legit, in which case there is no type tag either.
+            if index < len(self._dgram):
+                self._type_tag, index = osc_types.get_string(self._dgram, index)
+            self._args_index = index
+        except osc_types.ParseError as pe:
+            raise ParseError("Found incorrect datagram, ignoring it", pe)
+
+    def _parse_arguments(self) -> list[ArgValue]:
+        if not self._type_tag:
+            self._parameters = []
+            return self._parameters
+        try:
+            # Decode the parameters with the decoder compiled for this type tag.
+            self._parameters = decoder.get_decoder(self._type_tag).decode(self._dgram, self._args_index)
         except osc_types.ParseError as pe:
             raise ParseError("Found incorrect datagram, ignoring it", pe)
+        return self._parameters
 
     @property
     def address(self) -> str:
@@ -93,9 +93,9 @@ class OscMessage:
         return self._address_regexp
 
     @staticmethod
-    def dgram_is_message(dgram: bytes) -> bool:
+    def dgram_is_message(dgram: osc_types.Buffer) -> bool:
         """Returns whether this datagram starts as an OSC message."""
-        return dgram.startswith(b"/")
+        return dgram[:1] == b"/"
 
     @property
     def size(self) -> int:
@@ -103,15 +103,25 @@ class OscMessage:
         return len(self._dgram)
 
     @property
-    def dgram(self) -> bytes:
+    def dgram(self) -> osc_types.Buffer:
         """Returns the datagram from which this message was built."""
         return self._dgram
 
+    @property
+    def type_tag(self) -> str:
+        """Returns the OSC type tag string, including the leading comma (empty if the message has none)."""
+        return self._type_tag
+
     @property
     def params(self) -> list[ArgValue]:
-        """Convenience method for list(self) to get the list of parameters."""
-        return list(self)
+        """Returns the list of parameters, decoding them on first access.
+
+        The list is shared between calls and must not be modified.
+        """
+        if self._parameters is None:
+            return self._parse_arguments()
+        return self._parameters
 
     def __iter__(self) -> Iterator[ArgValue]:
         """Returns an iterator over the parameters of this message."""
-        return iter(self._parameters)
+        return iter(self.params)
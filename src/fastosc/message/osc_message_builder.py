@@ -11,14 +11,12 @@ from fastosc.message.arg_value import (
     ARG_TYPE_ARRAY_START,
     ARG_TYPE_ARRAY_STOP,
     ARG_TYPE_BLOB,
-    ARG_TYPE_DOUBLE,
     ARG_TYPE_FALSE,
     ARG_TYPE_FLOAT,
     ARG_TYPE_INT,
     ARG_TYPE_INT64,
     ARG_TYPE_MIDI,
     ARG_TYPE_NIL,
-    ARG_TYPE_RGBA,
     ARG_TYPE_STRING,
     ARG_TYPE_TIMETAG,
     ARG_TYPE_TRUE,
@@ -26,7 +24,8 @@ from fastosc.message.arg_value import (
     ArgValue,
 )
 
-from .parsing import osc_types
+from .parsing import encoder, osc_types
+from .parsing.ntp import TimeTag
 
 # ruff: noqa: PLR0912,B904
 
@@ -108,7 +107,7 @@ class OscMessageBuilder:
             arg_type = ARG_TYPE_TRUE
         elif arg_value is False:
             arg_type = ARG_TYPE_FALSE
-        elif isinstance(arg_value, datetime):
+        elif isinstance(arg_value, (datetime, TimeTag)):
             arg_type = ARG_TYPE_TIMETAG
         elif isinstance(arg_value, int):
             arg_type = ARG_TYPE_INT64 if arg_value.bit_length() > 32 else ARG_TYPE_INT
@@ -128,59 +127,35 @@ class OscMessageBuilder:
             raise ValueError("Infered arg_value type is not supported")
         return arg_type
 
-    def build(self) -> osc_message.OscMessage:
-        """Builds an OscMessage from the current state of this builder.
+    def build_dgram(self) -> bytes:
+        """Encodes the current state of this builder into a datagram.
 
         Raises:
           - BuildError: if the message could not be build or if the address
                         was empty.
 
         Returns:
-          - an osc_message.OscMessage instance.
+          - the datagram bytes of the message.
         """
         if not self._address:
             raise BuildError("OSC addresses cannot be empty")
-        dgram = b""
         try:
-            # Write the address.
-            dgram += osc_types.write_string(self._address)
-            if not self._args:
-                dgram += osc_types.write_string(",")
-                return osc_message.OscMessage(dgram)
-
-            # Write the parameters.
-            arg_types = "".join([arg[0] for arg in self._args])  # type: ignore[misc]
-            dgram += osc_types.write_string("," + arg_types)
-            for arg_type, value in self._args:
-                if arg_type == ARG_TYPE_STRING:
-                    dgram += osc_types.write_string(value)  # type: ignore[arg-type]
-                elif arg_type == ARG_TYPE_INT:
-                    dgram += osc_types.write_int(value)  # type: ignore[arg-type]
-                elif arg_type == ARG_TYPE_INT64:
-                    dgram += osc_types.write_int64(value)  # type: ignore[arg-type]
-                elif arg_type == ARG_TYPE_FLOAT:
-                    dgram += osc_types.write_float(value)  # type: ignore[arg-type]
-                elif arg_type == ARG_TYPE_TIMETAG:
-                    dgram += osc_types.write_timetag(value)  # type: ignore[arg-type]
-                elif arg_type == ARG_TYPE_DOUBLE:
-                    dgram += osc_types.write_double(value)  # type: ignore[arg-type]
-                elif arg_type == ARG_TYPE_BLOB:
-                    dgram += osc_types.write_blob(value)  # type: ignore[arg-type]
-                elif arg_type == ARG_TYPE_RGBA:
-                    dgram += osc_types.write_rgba(value)  # type: ignore[arg-type]
-                elif arg_type == ARG_TYPE_MIDI:
-                    dgram += osc_types.write_midi(value)  # type: ignore[arg-type]
-                elif arg_type in (
-                    ARG_TYPE_TRUE,
-                    ARG_TYPE_FALSE,
-                    ARG_TYPE_ARRAY_START,
-                    ARG_TYPE_ARRAY_STOP,
-                    ARG_TYPE_NIL,
-                ):
-                    continue
-                else:
-                    raise BuildError(f"Incorrect parameter type found {arg_type}")  # type: ignore[str-bytes-safe]
-
-            return osc_message.OscMessage(dgram)
+            return encoder.encode_message(
+                self._address,
+                "".join([arg[0] for arg in self._args]),
+                [arg[1] for arg in self._args],
+            )
         except osc_types.BuildError as be:
             raise BuildError(f"Could not build the message: {be}")
+
+    def build(self) -> osc_message.OscMessage:
+        """Builds an OscMessage from the current state of this builder.
+
+        Raises:
+          - BuildError: if the message could not be build or if the address
+                        was empty.
+
+        Returns:
+          - an osc_message.OscMessage instance.
+        """
+        return osc_message.OscMessage(self.build_dgram(), lazy=True)
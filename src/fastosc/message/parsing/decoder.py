@@ -0,0 +1,191 @@
+"""Argument decoders compiled once per OSC type tag string and cached."""
+
+# ruff: noqa: B904,PLR0912
+from __future__ import annotations
+
+import logging
+import struct
+from typing import Any, Callable, Tuple
+
+from fastosc.cache import CacheStats, LRUCache
+from fastosc.message.arg_value import (
+    ARG_TYPE_ARRAY_START,
+    ARG_TYPE_ARRAY_STOP,
+    ARG_TYPE_BLOB,
+    ARG_TYPE_DOUBLE,
+    ARG_TYPE_FALSE,
+    ARG_TYPE_FLOAT,
+    ARG_TYPE_INT,
+    ARG_TYPE_INT64,
+    ARG_TYPE_MIDI,
+    ARG_TYPE_NIL,
+    ARG_TYPE_RGBA,
+    ARG_TYPE_STRING,
+    ARG_TYPE_TIMETAG,
+    ARG_TYPE_TRUE,
+    ArgValue,
+)
+from fastosc.message.parsing import ntp, osc_types
+
+DECODER_CACHE_SIZE = 256
+
+# Fixed width types: struct format character and an optional conversion of the unpacked value.
+_FIXED_WIDTH_TYPES: dict[str, tuple[str, Callable[[Any], ArgValue] | None]] = {
+    ARG_TYPE_INT: ("i", None),
+    ARG_TYPE_INT64: ("q", None),
+    ARG_TYPE_FLOAT: ("f", None),
+    ARG_TYPE_DOUBLE: ("d", None),
+    ARG_TYPE_RGBA: ("I", None),
+    ARG_TYPE_MIDI: ("I", osc_types.midi_from_uint32),
+    ARG_TYPE_TIMETAG: ("Q", ntp.TimeTag),
+}
+_CONSTANT_TYPES: dict[str, ArgValue] = {
+    ARG_TYPE_TRUE: True,
+    ARG_TYPE_FALSE: False,
+    ARG_TYPE_NIL: None,
+}
+_FLOAT_SIZE = 4
+
+# Decoding steps: a run of consecutive fixed width arguments read with one struct, a variable length
+# argument, a constant without payload, or an array boundary.
+_STEP_STRUCT = 0
+_STEP_STRING = 1
+_STEP_BLOB = 2
+_STEP_CONSTANT = 3
+_STEP_ARRAY_START = 4
+_STEP_ARRAY_STOP = 5
+
+_Step = Tuple[int, Any]
+
+
+class TypeTagDecoder:
+    """Decodes the arguments of any message with a given type tag string.
+
+    Consecutive fixed width arguments are grouped into a single struct.Struct, so a message with only
+    int/float/double arguments is decoded with one unpack_from call.
+    """
+
+    __slots__ = ("_fixed", "_pad_last_float", "_steps", "type_tag")
+
+    def __init__(self, type_tag: str) -> None:
+        self.type_tag = type_tag
+        self._steps: list[_Step] = []
+        self._compile(type_tag[1:] if type_tag.startswith(",") else type_tag)
+        # Messages made of a single run of plain fixed width arguments skip the step loop entirely.
+        self._fixed: struct.Struct | None = None
+        if len(self._steps) == 1 and self._steps[0][0] == _STEP_STRUCT:
+            s, converters = self._steps[0][1]
+            if not any(converters):
+                self._fixed = s
+        # Reaktor omits the trailing padding of a final float in some cases, which get_float tolerates.
+        self._pad_last_float = (
+            type_tag.endswith(ARG_TYPE_FLOAT) and bool(self._steps) and self._steps[-1][0] == _STEP_STRUCT
+        )
+
+    def _compile(self, type_tag: str) -> None:
+        fmt = ""
+        converters: list[Callable[[Any], ArgValue] | None] = []
+        depth = 0
+
+        def flush() -> None:
+            nonlocal fmt, converters
+            if fmt:
+                self._steps.append((_STEP_STRUCT, (struct.Struct(f">{fmt}"), tuple(converters))))
+                fmt = ""
+                converters = []
+
+        for param in type_tag:
+            if param in _FIXED_WIDTH_TYPES:
+                code, converter = _FIXED_WIDTH_TYPES[param]
+                fmt += code
+                converters.append(converter)
+                continue
+            flush()
+            if param == ARG_TYPE_STRING:
+                self._steps.append((_STEP_STRING, None))
+            elif param == ARG_TYPE_BLOB:
+                self._steps.append((_STEP_BLOB, None))
+            elif param in _CONSTANT_TYPES:
+                self._steps.append((_STEP_CONSTANT, _CONSTANT_TYPES[param]))
+            elif param == ARG_TYPE_ARRAY_START:
+                depth += 1
+                self._steps.append((_STEP_ARRAY_START, None))
+            elif param == ARG_TYPE_ARRAY_STOP:
+                if depth < 1:
+                    raise osc_types.ParseError(f"Unexpected closing bracket in type tag: {type_tag}")
+                depth -= 1
+                self._steps.append((_STEP_ARRAY_STOP, None))
+            # TODO: Support more exotic types as described in the specification.
+            else:
+                logging.warning(f"Unhandled parameter type: {param}")
+        flush()
+        if depth:
+            raise osc_types.ParseError(f"Missing closing bracket in type tag: {type_tag}")
+
+    def decode(self, dgram: osc_types.Buffer, index: int) -> list[ArgValue]:
+        """Decode all arguments of the message, starting at the first argument's index in the datagram.
+
+        Raises:
+          ParseError if the datagram could not be parsed.
+        """
+        try:
+            if self._fixed is not None and index + self._fixed.size <= len(dgram):
+                return list(self._fixed.unpack_from(dgram, index))
+            params: list[ArgValue] = []
+            current = params
+            param_stack = [params]
+            last = len(self._steps) - 1
+            for i, (op, arg) in enumerate(self._steps):
+                if op == _STEP_STRUCT:
+                    s, converters = arg
+                    if index + s.size > len(dgram):
+                        if not (i == last and self._pad_last_float and index + s.size - len(dgram) < _FLOAT_SIZE):
+                            raise osc_types.ParseError("Datagram is too short")
+                        values = s.unpack(bytes(dgram[index:]) + b"\x00" * (index + s.size - len(dgram)))
+                    else:
+                        values = s.unpack_from(dgram, index)
+                    index += s.size
+                    if any(converters):
+                        current.extend(c(v) if c else v for c, v in zip(converters, values))
+                    else:
+                        current.extend(values)
+                elif op == _STEP_STRING:
+                    val, index = osc_types.get_string(dgram, index)
+                    current.append(val)
+                elif op == _STEP_BLOB:
+                    blob, index = osc_types.get_blob(dgram, index)
+                    current.append(blob)
+                elif op == _STEP_CONSTANT:
+                    current.append(arg)
+                elif op == _STEP_ARRAY_START:
+                    array: list[ArgValue] = []
+                    current.append(array)
+                    param_stack.append(array)
+                    current = array
+                else:
+                    param_stack.pop()
+                    current = param_stack[-1]
+            return params
+        except struct.error as e:
+            raise osc_types.ParseError(f"Could not parse datagram {e}")
+
+
+_decoders: LRUCache[str, TypeTagDecoder] = LRUCache(DECODER_CACHE_SIZE)
+
+
+def get_decoder(type_tag: str) -> TypeTagDecoder:
+    """Returns the cached decoder for a type tag string, compiling it on first use.
+
+    Raises:
+      ParseError if the type tag string is malformed.
+    """
+    decoder = _decoders.get(type_tag)
+    if decoder is None:
+        decoder = TypeTagDecoder(type_tag)
+        _decoders.put(type_tag, decoder)
+    return decoder
+
+
+def decoder_cache_stats() -> CacheStats:
+    """Hit/miss/eviction counters of the type tag decoder cache."""
+    return _decoders.stats
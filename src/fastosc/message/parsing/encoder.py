@@ -0,0 +1,119 @@
+"""Single pass encoding of OSC messages into a preallocated buffer."""
+
+# ruff: noqa: B904,PLR0912
+from __future__ import annotations
+
+import struct
+from typing import Sequence
+
+from fastosc.cache import CacheStats, LRUCache
+from fastosc.message.arg_value import (
+    ARG_TYPE_ARRAY_START,
+    ARG_TYPE_ARRAY_STOP,
+    ARG_TYPE_BLOB,
+    ARG_TYPE_DOUBLE,
+    ARG_TYPE_FALSE,
+    ARG_TYPE_FLOAT,
+    ARG_TYPE_INT,
+    ARG_TYPE_INT64,
+    ARG_TYPE_MIDI,
+    ARG_TYPE_NIL,
+    ARG_TYPE_RGBA,
+    ARG_TYPE_STRING,
+    ARG_TYPE_TIMETAG,
+    ARG_TYPE_TRUE,
+    ArgValue,
+)
+from fastosc.message.parsing import osc_types
+
+_FIXED_WIDTH_TYPES = {
+    ARG_TYPE_INT: struct.Struct(">i"),
+    ARG_TYPE_INT64: struct.Struct(">q"),
+    ARG_TYPE_FLOAT: struct.Struct(">f"),
+    ARG_TYPE_DOUBLE: struct.Struct(">d"),
+}
+_NO_PAYLOAD_TYPES = frozenset(
+    (ARG_TYPE_TRUE, ARG_TYPE_FALSE, ARG_TYPE_NIL, ARG_TYPE_ARRAY_START, ARG_TYPE_ARRAY_STOP),
+)
+
+PREFIX_CACHE_SIZE = 1024
+
+# Encoded (padded address + padded type tag) prefixes, keyed by address and type tag string.
+_prefixes: LRUCache[tuple[str, str], bytes] = LRUCache(PREFIX_CACHE_SIZE)
+
+
+def encode_prefix(address: str, arg_types: str) -> bytes:
+    """Returns the encoded address and type tag string of a message, cached per (address, arg_types).
+
+    Raises:
+      BuildError if the address could not be encoded.
+    """
+    key = (address, arg_types)
+    prefix = _prefixes.get(key)
+    if prefix is None:
+        prefix = osc_types.write_string(address) + osc_types.write_string(f",{arg_types}")
+        _prefixes.put(key, prefix)
+    return prefix
+
+
+def prefix_cache_stats() -> CacheStats:
+    """Hit/miss/eviction counters of the encoded prefix cache."""
+    return _prefixes.stats
+
+
+def encode_message(address: str, arg_types: str, arg_values: Sequence[ArgValue]) -> bytes:
+    """Encode an OSC message into a datagram.
+
+    The final size is computed first and every part is then written into a single preallocated buffer.
+    The address and type tag prefix comes from a cache, so steady state sends only encode the arguments.
+
+    Args:
+      address: The OSC address of the message.
+      arg_types: The type tag string without the leading comma, one ARG_TYPE_* character per argument.
+      arg_values: One value per type tag character, values for types without payload are ignored.
+
+    Raises:
+      BuildError if an argument could not be encoded.
+    """
+    head = encode_prefix(address, arg_types)
+    size = len(head)
+    # Fixed width values are kept with their struct, variable length values are encoded right away.
+    parts: list[tuple[struct.Struct | None, ArgValue]] = []
+    for arg_type, value in zip(arg_types, arg_values):
+        fixed = _FIXED_WIDTH_TYPES.get(arg_type)
+        if fixed is not None:
+            size += fixed.size
+            parts.append((fixed, value))
+            continue
+        if arg_type in _NO_PAYLOAD_TYPES:
+            continue
+        if arg_type == ARG_TYPE_STRING:
+            encoded = osc_types.write_string(value)  # type: ignore[arg-type]
+        elif arg_type == ARG_TYPE_BLOB:
+            encoded = osc_types.write_blob(value)  # type: ignore[arg-type]
+        elif arg_type == ARG_TYPE_TIMETAG:
+            encoded = osc_types.write_timetag(value)  # type: ignore[arg-type]
+        elif arg_type == ARG_TYPE_RGBA:
+            encoded = osc_types.write_rgba(value)  # type: ignore[arg-type]
+        elif arg_type == ARG_TYPE_MIDI:
+            encoded = osc_types.write_midi(value)  # type: ignore[arg-type]
+        else:
+            raise osc_types.BuildError(f"Incorrect parameter type found {arg_type}")
+        size += len(encoded)
+        parts.append((None, encoded))
+
+    dgram = bytearray(size)
+    offset = len(head)
+    dgram[:offset] = head
+    try:
+        for fixed, value in parts:
+            if fixed is None:
+                end = offset + len(value)  # type: ignore[arg-type]
+                dgram[offset:end] = value  # type: ignore[assignment]
+                offset = end
+            else:
+                fixed.pack_into(dgram, offset, value)
+                offset += fixed.size
+    except struct.error as e:
+        raise osc_types.BuildError(f"Wrong argument value passed: {e}")
+    return bytes(dgram)
@@ -1,14 +1,17 @@
 """Parsing and conversion of NTP dates contained in datagrams."""
+
 # ruff: noqa: BLE001,B904
+from __future__ import annotations
 
 import datetime
 import struct
 import time
-from typing import NamedTuple
+from typing import Any, NamedTuple
 
 # 63 zero bits followed by a one in the least signifigant bit is a special
 # case meaning "immediately."
 IMMEDIATELY = struct.pack(">Q", 1)
+IMMEDIATELY_TIMETAG = 1
 
 # timetag * (1 / 2 ** 32) == l32bits + (r32bits / 1 ** 32)
 _NTP_TIMESTAMP_TO_SECONDS = 1.0 / 2.0**32.0
@@ -20,6 +23,13 @@ _NTP_EPOCH = datetime.date(1900, 1, 1)
 # _NTP_DELTA is 2208988800
 _NTP_DELTA = (_SYSTEM_EPOCH - _NTP_EPOCH).days * 24 * 3600
 
+_FRACTION_BITS = 32
+_FRACTION_MASK = 0xFFFFFFFF
+_FRACTION_UNITS = 1 << _FRACTION_BITS
+_MAX_TIMETAG = (1 << 64) - 1
+_NTP_EPOCH_UTC = datetime.datetime(1900, 1, 1, tzinfo=datetime.timezone.utc)
+_UINT64 = struct.Struct(">Q")
+
 
 class Timestamp(NamedTuple):
     seconds: int
@@ -49,10 +59,9 @@ def ntp_to_system_time(timestamp: bytes) -> float:
 def system_time_to_ntp(seconds: float) -> bytes:
     """Convert a system time in seconds to NTP timestamp."""
     try:
-        seconds = seconds + _NTP_DELTA
-    except TypeError as e:
+        return TimeTag.from_seconds(seconds).to_bytes()
+    except (TypeError, ValueError, OverflowError) as e:
         raise NtpError(e)
-    return struct.pack(">Q", int(seconds * _SECONDS_TO_NTP_TIMESTAMP))
 
 
 def ntp_time_to_system_epoch(seconds: float) -> float:
@@ -63,3 +72,125 @@ def ntp_time_to_system_epoch(seconds: float) -> float:
 def system_time_to_ntp_epoch(seconds: float) -> float:
     """Convert a system time in seconds to NTP time in seconds."""
     return seconds + _NTP_DELTA
+
+
+def ntp_timetag_now() -> int:
+    """Returns the current system time as a raw 64-bit NTP time tag."""
+    seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+    return ((seconds + _NTP_DELTA) << _FRACTION_BITS) | ((nanoseconds << _FRACTION_BITS) // 1_000_000_000)
+
+
+def timetag_to_system_time(timetag: int) -> float:
+    """Convert a raw 64-bit NTP time tag to system time in seconds.
+
+    The whole seconds are converted as integers, so only the fraction is subject to float rounding.
+    """
+    return ((timetag >> _FRACTION_BITS) - _NTP_DELTA) + (timetag & _FRACTION_MASK) / _FRACTION_UNITS
+
+
+class TimeTag:
+    """An OSC time tag, stored as the raw 64-bit NTP value (32 bits of seconds since 1900, 32 bits of fraction).
+
+    Comparisons, hashing and encoding work on the integer. The conversions to system time and to a
+    datetime are only done when asked for (and the datetime is cached).
+    """
+
+    __slots__ = ("_datetime", "ntp")
+
+    def __init__(self, ntp: int) -> None:
+        """
+        Args:
+          ntp: the raw 64-bit NTP time tag.
+
+        Raises:
+          ValueError: if ntp does not fit in 64 bits unsigned.
+        """
+        if not 0 <= ntp <= _MAX_TIMETAG:
+            raise ValueError(f"NTP time tag out of range: {ntp}")
+        self.ntp = ntp
+        self._datetime: datetime.datetime | None = None
+
+    @staticmethod
+    def from_seconds(seconds: float) -> TimeTag:
+        """Returns the time tag of a system time in seconds (as returned by time.time())."""
+        whole = int(seconds // 1)
+        fraction = round((seconds - whole) * _FRACTION_UNITS)
+        if fraction == _FRACTION_UNITS:
+            whole, fraction = whole + 1, 0
+        return TimeTag(((whole + _NTP_DELTA) << _FRACTION_BITS) | fraction)
+
+    @staticmethod
+    def from_datetime(value: datetime.datetime) -> TimeTag:
+        """Returns the time tag of a datetime, naive datetimes are taken as utc (like the datetime property)."""
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        delta = value - _NTP_EPOCH_UTC
+        seconds = delta.days * 86400 + delta.seconds
+        fraction = (delta.microseconds << _FRACTION_BITS) // 1_000_000
+        return TimeTag((seconds << _FRACTION_BITS) | fraction)
+
+    @staticmethod
+    def now() -> TimeTag:
+        """Returns the time tag of the current system time."""
+        return TimeTag(ntp_timetag_now())
+
+    @property
+    def seconds(self) -> int:
+        """Whole seconds since the NTP epoch (1900-01-01)."""
+        return self.ntp >> _FRACTION_BITS
+
+    @property
+    def fraction(self) -> int:
+        """Fraction of the second in units of 1/2**32 seconds."""
+        return self.ntp & _FRACTION_MASK
+
+    @property
+    def is_immediately(self) -> bool:
+        """Whether this is the special "immediately" time tag."""
+        return self.ntp == IMMEDIATELY_TIMETAG
+
+    @property
+    def timestamp(self) -> float:
+        """System time in seconds."""
+        return timetag_to_system_time(self.ntp)
+
+    @property
+    def datetime(self) -> datetime.datetime:
+        """Naive utc datetime, rounded to the microsecond."""
+        if self._datetime is None:
+            microseconds = (self.fraction * 1_000_000 + (1 << (_FRACTION_BITS - 1))) >> _FRACTION_BITS
+            utc = _NTP_EPOCH_UTC + datetime.timedelta(seconds=self.seconds, microseconds=microseconds)
+            self._datetime = utc.replace(tzinfo=None)
+        return self._datetime
+
+    def to_bytes(self) -> bytes:
+        """Returns the datagram of this time tag."""
+        return _UINT64.pack(self.ntp)
+
+    def __int__(self) -> int:
+        return self.ntp
+
+    def __eq__(self, other: Any) -> bool:  # noqa: ANN401
+        if isinstance(other, TimeTag):
+            return self.ntp == other.ntp
+        return NotImplemented
+
+    def __lt__(self, other: TimeTag) -> bool:
+        return self.ntp < other.ntp
+
+    def __le__(self, other: TimeTag) -> bool:
+        return self.ntp <= other.ntp
+
+    def __gt__(self, other: TimeTag) -> bool:
+        return self.ntp > other.ntp
+
+    def __ge__(self, other: TimeTag) -> bool:
+        return self.ntp >= other.ntp
+
+    def __hash__(self) -> int:
+        return hash(self.ntp)
+
+    def __repr__(self) -> str:
+        if self.is_immediately:
+            return "TimeTag(IMMEDIATELY)"
+        return f"TimeTag({self.datetime.isoformat()}Z)"
@@ -3,15 +3,19 @@
 # ruff: noqa: FBT001,FBT002,B904
 from __future__ import annotations
 
-import math
+import re
 import struct
-from datetime import datetime, timedelta
-from typing import Tuple, cast
+from datetime import datetime
+from typing import Tuple, Union, cast
 
 from fastosc.message.parsing import ntp
 
 MidiPacket = Tuple[int, int, int, int]
 
+# Anything the get_* functions can parse from. Parsing only works with offsets into the buffer and never
+# copies the remainder of the datagram, so a memoryview over a receive buffer is parsed in place.
+Buffer = Union[bytes, bytearray, memoryview]
+
 
 class ParseError(Exception):
     """Base exception for when a datagram parsing error occurs."""
@@ -34,7 +38,13 @@ _TIMETAG_DGRAM_LEN = 8
 # Strings and blob dgram length is always a multiple of 4 bytes.
 _STRING_DGRAM_PAD = 4
 _BLOB_DGRAM_PAD = 4
-_EMPTY_STR_DGRAM = b"\x00\x00\x00\x00"
+
+_INT = struct.Struct(">i")
+_INT64 = struct.Struct(">q")
+_UINT32 = struct.Struct(">I")
+_UINT64 = struct.Struct(">Q")
+_FLOAT = struct.Struct(">f")
+_DOUBLE = struct.Struct(">d")
 
 
 def write_string(val: str) -> bytes:
@@ -52,7 +62,39 @@ def write_string(val: str) -> bytes:
     return dgram
 
 
-def get_string(dgram: bytes, start_index: int) -> tuple[str, int]:
+# memoryviews have no find(), but compiled bytes patterns search any buffer in place.
+_NULL_PATTERN = re.compile(b"\x00")
+
+
+def get_string_bounds(dgram: Buffer, start_index: int) -> tuple[int, int]:
+    """Find the end of the string starting at pos start_index, see get_string().
+
+    Returns:
+      A tuple containing the index of the string terminator and the index after the padding.
+
+    Raises:
+      ParseError if the datagram could not be parsed.
+    """
+    if start_index < 0:
+        raise ParseError("start_index < 0")
+    try:
+        if isinstance(dgram, memoryview):
+            match = _NULL_PATTERN.search(dgram, start_index)
+            str_end = match.start() if match is not None else -1
+        else:
+            str_end = dgram.find(b"\x00", start_index)
+    except TypeError as te:
+        raise ParseError(f"Could not parse datagram {te}")
+    if str_end < 0:
+        raise ParseError("Datagram is too short, string is not terminated")
+    # Align to a byte word, the terminator always takes at least one byte of padding.
+    end_index = str_end + _STRING_DGRAM_PAD - (str_end - start_index) % _STRING_DGRAM_PAD
+    if end_index > len(dgram):
+        raise ParseError("Datagram is too short")
+    return str_end, end_index
+
+
+def get_string(dgram: Buffer, start_index: int) -> tuple[str, int]:
     """Get a python string from the datagram, starting at pos start_index.
 
     According to the specifications, a string is:
@@ -70,29 +112,8 @@ def get_string(dgram: bytes, start_index: int) -> tuple[str, int]:
     Raises:
       ParseError if the datagram could not be parsed.
     """
-    if start_index < 0:
-        raise ParseError("start_index < 0")
-    offset = 0
-    try:
-        if len(dgram) > start_index + _STRING_DGRAM_PAD and dgram[start_index + _STRING_DGRAM_PAD] == _EMPTY_STR_DGRAM:
-            return "", start_index + _STRING_DGRAM_PAD
-        while dgram[start_index + offset] != 0:
-            offset += 1
-        # Align to a byte word.
-        if (offset) % _STRING_DGRAM_PAD == 0:
-            offset += _STRING_DGRAM_PAD
-        else:
-            offset += -offset % _STRING_DGRAM_PAD
-        # Python slices do not raise an IndexError past the last index,
-        # do it ourselves.
-        if offset > len(dgram[start_index:]):
-            raise ParseError("Datagram is too short")
-        data_str = dgram[start_index : start_index + offset]
-        return data_str.replace(b"\x00", b"").decode("utf-8"), start_index + offset
-    except IndexError as ie:
-        raise ParseError(f"Could not parse datagram {ie}")
-    except TypeError as te:
-        raise ParseError(f"Could not parse datagram {te}")
+    str_end, end_index = get_string_bounds(dgram, start_index)
+    return str(dgram[start_index:str_end], "utf-8"), end_index
 
 
 def write_int(val: int) -> bytes:
@@ -107,7 +128,7 @@ def write_int(val: int) -> bytes:
         raise BuildError(f"Wrong argument value passed: {e}")
 
 
-def get_int(dgram: bytes, start_index: int) -> tuple[int, int]:
+def get_int(dgram: Buffer, start_index: int) -> tuple[int, int]:
     """Get a 32-bit big-endian two's complement integer from the datagram.
 
     Args:
@@ -121,9 +142,9 @@ def get_int(dgram: bytes, start_index: int) -> tuple[int, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT_DGRAM_LEN:
+        if len(dgram) - start_index < _INT_DGRAM_LEN:
             raise ParseError("Datagram is too short")
-        return (struct.unpack(">i", dgram[start_index : start_index + _INT_DGRAM_LEN])[0], start_index + _INT_DGRAM_LEN)
+        return _INT.unpack_from(dgram, start_index)[0], start_index + _INT_DGRAM_LEN
     except (struct.error, TypeError) as e:
         raise ParseError(f"Could not parse datagram {e}")
 
@@ -140,7 +161,7 @@ def write_int64(val: int) -> bytes:
         raise BuildError(f"Wrong argument value passed: {e}")
 
 
-def get_int64(dgram: bytes, start_index: int) -> tuple[int, int]:
+def get_int64(dgram: Buffer, start_index: int) -> tuple[int, int]:
     """Get a 64-bit big-endian signed integer from the datagram.
 
     Args:
@@ -154,17 +175,14 @@ def get_int64(dgram: bytes, start_index: int) -> tuple[int, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT64_DGRAM_LEN:
+        if len(dgram) - start_index < _INT64_DGRAM_LEN:
             raise ParseError("Datagram is too short")
-        return (
-            struct.unpack(">q", dgram[start_index : start_index + _INT64_DGRAM_LEN])[0],
-            start_index + _INT64_DGRAM_LEN,
-        )
+        return _INT64.unpack_from(dgram, start_index)[0], start_index + _INT64_DGRAM_LEN
     except (struct.error, TypeError) as e:
         raise ParseError(f"Could not parse datagram {e}")
 
 
-def get_uint64(dgram: bytes, start_index: int) -> tuple[int, int]:
+def get_uint64(dgram: Buffer, start_index: int) -> tuple[int, int]:
     """Get a 64-bit big-endian unsigned integer from the datagram.
 
     Args:
@@ -178,30 +196,35 @@ def get_uint64(dgram: bytes, start_index: int) -> tuple[int, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _UINT64_DGRAM_LEN:
+        if len(dgram) - start_index < _UINT64_DGRAM_LEN:
             raise ParseError("Datagram is too short")
-        return (
-            struct.unpack(">Q", dgram[start_index : start_index + _UINT64_DGRAM_LEN])[0],
-            start_index + _UINT64_DGRAM_LEN,
-        )
+        return _UINT64.unpack_from(dgram, start_index)[0], start_index + _UINT64_DGRAM_LEN
     except (struct.error, TypeError) as e:
         raise ParseError(f"Could not parse datagram {e}")
 
 
-def write_timetag(ts: float | datetime) -> bytes:
-    # do conversion
-    if isinstance(ts, datetime):
-        ts = ts.timestamp()
-    if ts > 0:
-        fract, secs = math.modf(ts)
-        binary = struct.pack(">LL", secs, fract)
-    else:
-        binary = struct.pack(">LL", 0, 1)
+def write_timetag(ts: float | datetime | ntp.TimeTag) -> bytes:
+    """Returns the datagram for the given time tag value, a TimeTag, a datetime (naive ones are taken as utc) or
+    a system time in seconds.
 
-    return binary
+    Values of 0 or less are encoded as the special "immediately" time tag.
 
+    Raises:
+      - BuildError if the value could not be converted.
+    """
+    if isinstance(ts, ntp.TimeTag):
+        return _UINT64.pack(ts.ntp)
+    try:
+        if isinstance(ts, datetime):
+            return _UINT64.pack(ntp.TimeTag.from_datetime(ts).ntp)
+        if ts > 0:
+            return _UINT64.pack(ntp.TimeTag.from_seconds(ts).ntp)
+    except (TypeError, ValueError, OverflowError) as e:
+        raise BuildError(f"Wrong argument value passed: {e}")
+    return ntp.IMMEDIATELY
 
-def get_timetag(dgram: bytes, start_index: int) -> tuple[tuple[datetime, int], int]:
+
+def get_timetag(dgram: Buffer, start_index: int) -> tuple[ntp.TimeTag, int]:
     """Get a 64-bit OSC time tag from the datagram.
 
     Args:
@@ -209,32 +232,18 @@ def get_timetag(dgram: bytes, start_index: int) -> tuple[tuple[datetime, int], i
       start_index: An index where the osc time tag starts in the datagram.
 
     Returns:
-      A tuple containing the tuple of time of sending in utc as datetime and the
-      fraction of the current second and the new end index.
+      A tuple containing the TimeTag and the new end index.
 
     Raises:
       ParseError if the datagram could not be parsed.
     """
+    if len(dgram) - start_index < _TIMETAG_DGRAM_LEN:
+        raise ParseError("Datagram is too short")
     try:
-        if len(dgram[start_index:]) < _TIMETAG_DGRAM_LEN:
-            raise ParseError("Datagram is too short")
-
-        timetag, _ = get_uint64(dgram, start_index)
-        seconds, fraction = ntp.parse_timestamp(timetag)
-
-        hours, seconds = seconds // 3600, seconds % 3600
-        minutes, seconds = seconds // 60, seconds % 60
-
-        utc = datetime.combine(ntp._NTP_EPOCH, datetime.min.time()) + timedelta(
-            hours=hours,
-            minutes=minutes,
-            seconds=seconds,
-            microseconds=fraction,
-        )
-
-        return (utc, fraction), start_index + _TIMETAG_DGRAM_LEN
+        timetag, start_index = get_uint64(dgram, start_index)
     except (struct.error, TypeError) as e:
         raise ParseError(f"Could not parse datagram {e}")
+    return ntp.TimeTag(timetag), start_index
 
 
 def write_float(val: float) -> bytes:
@@ -249,7 +258,7 @@ def write_float(val: float) -> bytes:
         raise BuildError(f"Wrong argument value passed: {e}")
 
 
-def get_float(dgram: bytes, start_index: int) -> tuple[float, int]:
+def get_float(dgram: Buffer, start_index: int) -> tuple[float, int]:
     """Get a 32-bit big-endian IEEE 754 floating point number from the datagram.
 
     Args:
@@ -263,15 +272,14 @@ def get_float(dgram: bytes, start_index: int) -> tuple[float, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _FLOAT_DGRAM_LEN:
+        remaining = len(dgram) - start_index
+        if remaining < _FLOAT_DGRAM_LEN:
             # Noticed that Reaktor doesn't send the last bunch of \x00 needed to make
             # the float representation complete in some cases, thus we pad here to
             # account for that.
-            dgram = dgram + b"\x00" * (_FLOAT_DGRAM_LEN - len(dgram[start_index:]))
-        return (
-            struct.unpack(">f", dgram[start_index : start_index + _FLOAT_DGRAM_LEN])[0],
-            start_index + _FLOAT_DGRAM_LEN,
-        )
+            padded = bytes(dgram[start_index:]) + b"\x00" * (_FLOAT_DGRAM_LEN - remaining)
+            return _FLOAT.unpack(padded)[0], start_index + _FLOAT_DGRAM_LEN
+        return _FLOAT.unpack_from(dgram, start_index)[0], start_index + _FLOAT_DGRAM_LEN
     except (struct.error, TypeError) as e:
         raise ParseError(f"Could not parse datagram {e}")
 
@@ -288,7 +296,7 @@ def write_double(val: float) -> bytes:
         raise BuildError(f"Wrong argument value passed: {e}")
 
 
-def get_double(dgram: bytes, start_index: int) -> tuple[float, int]:
+def get_double(dgram: Buffer, start_index: int) -> tuple[float, int]:
     """Get a 64-bit big-endian IEEE 754 floating point number from the datagram.
 
     Args:
@@ -302,17 +310,14 @@ def get_double(dgram: bytes, start_index: int) -> tuple[float, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _DOUBLE_DGRAM_LEN:
+        if len(dgram) - start_index < _DOUBLE_DGRAM_LEN:
             raise ParseError("Datagram is too short")
-        return (
-            struct.unpack(">d", dgram[start_index : start_index + _DOUBLE_DGRAM_LEN])[0],
-            start_index + _DOUBLE_DGRAM_LEN,
-        )
+        return _DOUBLE.unpack_from(dgram, start_index)[0], start_index + _DOUBLE_DGRAM_LEN
     except (struct.error, TypeError) as e:
         raise ParseError(f"Could not parse datagram {e}")
 
 
-def get_blob(dgram: bytes, start_index: int) -> tuple[bytes, int]:
+def get_blob(dgram: Buffer, start_index: int) -> tuple[bytes, int]:
     """Get a blob from the datagram.
 
     According to the specifications, a blob is made of
@@ -334,9 +339,9 @@ def get_blob(dgram: bytes, start_index: int) -> tuple[bytes, int]:
     # Make the size a multiple of 32 bits.
     total_size = size + (-size % _BLOB_DGRAM_PAD)
     end_index = int_offset + size
-    if end_index - start_index > len(dgram[start_index:]):
+    if end_index > len(dgram):
         raise ParseError("Datagram is too short.")
-    return dgram[int_offset : int_offset + size], int_offset + total_size
+    return bytes(dgram[int_offset:end_index]), int_offset + total_size
 
 
 def write_blob(val: bytes) -> bytes:
@@ -354,7 +359,7 @@ def write_blob(val: bytes) -> bytes:
     return dgram
 
 
-def get_date(dgram: bytes, start_index: int) -> tuple[float, int]:
+def get_date(dgram: Buffer, start_index: int) -> tuple[float, int]:
     """Get a 64-bit big-endian fixed-point time tag as a date from the datagram.
 
     According to the specifications, a date is represented as is:
@@ -376,11 +381,10 @@ def get_date(dgram: bytes, start_index: int) -> tuple[float, int]:
     # Check for the special case first.
     if dgram[start_index : start_index + _TIMETAG_DGRAM_LEN] == ntp.IMMEDIATELY:
         return IMMEDIATELY, start_index + _TIMETAG_DGRAM_LEN
-    if len(dgram[start_index:]) < _TIMETAG_DGRAM_LEN:
+    if len(dgram) - start_index < _TIMETAG_DGRAM_LEN:
         raise ParseError("Datagram is too short")
     timetag, start_index = get_uint64(dgram, start_index)
-    seconds = timetag * ntp._NTP_TIMESTAMP_TO_SECONDS
-    return ntp.ntp_time_to_system_epoch(seconds), start_index
+    return ntp.timetag_to_system_time(timetag), start_index
 
 
 def write_date(system_time: int | float) -> bytes:
@@ -405,7 +409,7 @@ def write_rgba(val: bytes) -> bytes:
         raise BuildError(f"Wrong argument value passed: {e}")
 
 
-def get_rgba(dgram: bytes, start_index: int) -> tuple[bytes, int]:
+def get_rgba(dgram: Buffer, start_index: int) -> tuple[bytes, int]:
     """Get an rgba32 integer from the datagram.
 
     Args:
@@ -419,9 +423,9 @@ def get_rgba(dgram: bytes, start_index: int) -> tuple[bytes, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT_DGRAM_LEN:
+        if len(dgram) - start_index < _INT_DGRAM_LEN:
             raise ParseError("Datagram is too short")
-        return (struct.unpack(">I", dgram[start_index : start_index + _INT_DGRAM_LEN])[0], start_index + _INT_DGRAM_LEN)
+        return _UINT32.unpack_from(dgram, start_index)[0], start_index + _INT_DGRAM_LEN
     except (struct.error, TypeError) as e:
         raise ParseError(f"Could not parse datagram {e}")
 
@@ -447,7 +451,12 @@ def write_midi(val: MidiPacket) -> bytes:
         raise BuildError(f"Wrong argument value passed: {e}")
 
 
-def get_midi(dgram: bytes, start_index: int) -> tuple[MidiPacket, int]:
+def midi_from_uint32(val: int) -> MidiPacket:
+    """Split a 32-bit integer into a MIDI message (port id, status byte, data1, data2)."""
+    return cast(MidiPacket, tuple((val & 0xFF << 8 * i) >> 8 * i for i in range(3, -1, -1)))
+
+
+def get_midi(dgram: Buffer, start_index: int) -> tuple[MidiPacket, int]:
     """Get a MIDI message (port id, status byte, data1, data2) from the datagram.
 
     Args:
@@ -461,10 +470,9 @@ def get_midi(dgram: bytes, start_index: int) -> tuple[MidiPacket, int]:
       ParseError if the datagram could not be parsed.
     """
     try:
-        if len(dgram[start_index:]) < _INT_DGRAM_LEN:
+        if len(dgram) - start_index < _INT_DGRAM_LEN:
             raise ParseError("Datagram is too short")
-        val = struct.unpack(">I", dgram[start_index : start_index + _INT_DGRAM_LEN])[0]
-        midi_msg = cast(MidiPacket, tuple((val & 0xFF << 8 * i) >> 8 * i for i in range(3, -1, -1)))
-        return (midi_msg, start_index + _INT_DGRAM_LEN)
+        val = _UINT32.unpack_from(dgram, start_index)[0]
+        return midi_from_uint32(val), start_index + _INT_DGRAM_LEN
     except (struct.error, TypeError) as e:
         raise ParseError(f"Could not parse datagram {e}")
@@ -1,14 +1,25 @@
-# ruff: noqa: FBT001,FBT002
+# ruff: noqa: FBT001,FBT002,PLR0913
 from __future__ import annotations
 
+import functools
 import inspect
 import logging
-from typing import Any, Callable
+import math
+import time
+from typing import Any, Callable, Sequence
 
 from fastosc.dispatcher import Dispatcher
 from fastosc.dispatcher.handler import HandlerInfo
 from fastosc.message.arg_value import ArgValue
-from fastosc.message.osc_message import OscMessage
+from fastosc.message.osc_message import OscMessage  # noqa: F401 (for evaluating string annotations)
+from fastosc.router.subscriptions import (
+    GroupKey,
+    ListenerGroup,
+    ListenerRegistry,
+    Subscription,
+    listener_key,
+)
+from fastosc.router.throttle import ListenerThrottle, ListenOptions
 
 
 def _format_response(arg_value: ArgValue) -> list[ArgValue]:
@@ -17,72 +28,133 @@ def _format_response(arg_value: ArgValue) -> list[ArgValue]:
     return [arg_value]
 
 
+def _check_arg(a: ArgValue, t: Any) -> ArgValue:  # noqa: ANN401
+    """
+    Returns the argument if it is of the annotated type, converted to float for float annotations and int
+    arguments, raises InvalidParameterValueException otherwise.
+    """
+    if t is float and isinstance(a, int) and not isinstance(a, bool):
+        return float(a)
+    if isinstance(a, t):
+        return a
+    q = "'" if isinstance(a, str) else ""
+    raise InvalidParameterValueException(
+        f"arg {q}{a}{q} of type <{type(a).__name__}> "  # type: ignore[str-bytes-safe]
+        f"does not match <{t.__name__}>",
+    )
+
+
+def _compile_invocation(
+    *,
+    arg_types: list[Any],
+    min_arg_count: int,
+    max_arg_count: int,
+    include_remote_addr: bool,
+    include_original_message: bool,
+    validate: bool,
+) -> Callable[[list[ArgValue], tuple[str, int]], list[Any]]:
+    """
+    Build the function that validates the message arguments of a handler and assembles its call arguments,
+    once when the handler is decorated instead of on every message.
+    """
+    checks = tuple((i, t) for i, t in enumerate(arg_types) if t is not inspect.Parameter.empty and t is not Any)
+
+    if validate:
+
+        def check(original_args: list[ArgValue]) -> list[ArgValue]:
+            count = len(original_args)
+            if count < min_arg_count or count > max_arg_count:
+                expected = max_arg_count if min_arg_count == max_arg_count else f"{min_arg_count} to {max_arg_count}"
+                raise InvalidParameterValueException(f"expected {expected} arguments but got {count}")
+            args = original_args
+            for i, t in checks:
+                if i >= count:
+                    break
+                a = args[i]
+                # exact type match is the common case, only fall back to coercion / isinstance otherwise
+                if type(a) is not t:
+                    checked = _check_arg(a, t)
+                    if checked is not a:
+                        if args is original_args:
+                            args = list(original_args)
+                        args[i] = checked
+            return args
+
+    else:
+
+        def check(original_args: list[ArgValue]) -> list[ArgValue]:
+            return original_args
+
+    if include_remote_addr and include_original_message:
+        return lambda original_args, remote_address: [*check(original_args), remote_address, original_args]
+    if include_remote_addr:
+        return lambda original_args, remote_address: [*check(original_args), remote_address]
+    if include_original_message:
+        return lambda original_args, remote_address: [*check(original_args), original_args]
+    return lambda original_args, remote_address: check(original_args)
+
+
 def wrapper(
     address: str,
     prefix_: str,
     include_original_message: bool = False,
     include_remote_addr: bool = False,
     listen: bool = False,
+    listen_options: ListenOptions | None = None,
+    validate: bool = True,
 ) -> Callable[..., Callable[[list[ArgValue], tuple[str, int]], list[ArgValue]]]:
     if not address.startswith("/"):
         address = f"/{address}"
 
-    # todo maybe clean up this code a little bit as it was changed to infer parameter types
-    # from handler function signature vs annotation
     def check_accepts(
         f: Callable[..., Any],
     ) -> Callable:
         sign = inspect.signature(f)
-        shape = [sign.parameters[p].annotation for p in sign.parameters]
-        shape = [eval(t) if isinstance(t, str) else t for t in shape]
-        if len(shape) == 1:
-            shape = []
-        if len(shape) > 1:
-            shape = shape[1:]
-        orignal_shape = shape
-        if not shape:
-            shape = []
-        if not isinstance(shape, list):
-            shape = [shape]
-
-        shape = [OSCRouter, *shape]
-        if include_remote_addr:
-            shape = [*shape, tuple]
-        if include_original_message:
-            shape = [*shape, OscMessage]  # todo: osc.Message here as well for validation
-
-        arg_count = f.__code__.co_argcount - 1
-
-        shape_len = len(shape) - 1
-
-        if shape_len < arg_count:
-            raise InvalidParameterValueException(
-                f"too many arguments, expected {shape_len} " f"arguments but signature has {arg_count}.",
-            )
-        if shape_len > arg_count:
+        # the parameters after self: the message arguments, then the optional remote address and message
+        parameters = list(sign.parameters.values())[1:]
+        orignal_shape = [eval(p.annotation) if isinstance(p.annotation, str) else p.annotation for p in parameters]
+        if any(p.kind not in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD) for p in parameters):
+            raise InvalidParameterValueException(f"{f.__name__}: only positional parameters are supported")
+
+        extra_count = int(include_remote_addr) + int(include_original_message)
+        arg_count = len(parameters) - extra_count
+        if arg_count < 0:
             raise InvalidParameterValueException(
-                f"too few arguments, expected {shape_len} " f"arguments but signature has {arg_count}.",
+                f"too few arguments, expected at least {extra_count} arguments but signature has {len(parameters)}.",
             )
+        min_arg_count = sum(1 for p in parameters[:arg_count] if p.default is p.empty)
+        build_args = _compile_invocation(
+            arg_types=orignal_shape[:arg_count],
+            min_arg_count=min_arg_count,
+            max_arg_count=arg_count,
+            include_remote_addr=include_remote_addr,
+            include_original_message=include_original_message,
+            validate=validate,
+        )
 
-        # do we do someting with remote_addres?
-        # maybe include it if part of parameters? remote_addr param - inject as final param if needed
-        def new_f(self: OSCRouter, original_args: list[ArgValue], remote_address: tuple[str, int]) -> list[ArgValue]:
-            for a, t in zip(original_args, shape[1:] if len(shape) > 1 else []):
-                q = "'" if isinstance(a, str) else ""
-                if not isinstance(a, t):
-                    raise InvalidParameterValueException(
-                        f"arg {q}{a}{q} of type <{type(a).__name__}> "  # type: ignore[str-bytes-safe]
-                        f"does not match <{t.__name__}>",
-                    )
-            args = original_args
-            if include_remote_addr:
-                args = [*original_args, remote_address]  # type: ignore[list-item]
-            if include_original_message:
-                args = [*args, original_args]  # type: ignore[list-item]
-            return _format_response(f(self, *args))
+        if inspect.iscoroutinefunction(f):
+            # async handlers return a coroutine, which the dispatcher runs on the event loop before replying
+            async def new_f_async(
+                self: OSCRouter,
+                original_args: list[ArgValue],
+                remote_address: tuple[str, int],
+            ) -> list[ArgValue]:
+                return _format_response(await f(self, *build_args(original_args, remote_address)))
+
+            new_f = new_f_async
+        else:
+
+            def new_f(  # type: ignore[misc]
+                self: OSCRouter,
+                original_args: list[ArgValue],
+                remote_address: tuple[str, int],
+            ) -> list[ArgValue]:
+                return _format_response(f(self, *build_args(original_args, remote_address)))
 
         if listen:
             new_f.listen = True  # type: ignore[attr-defined]
+            new_f.listen_options = listen_options  # type: ignore[attr-defined]
+            new_f.include_remote_addr = include_remote_addr  # type: ignore[attr-defined]
         new_f.osc_handler = True  # type: ignore[attr-defined]
         new_f.address = f"/{prefix_}{address}"  # type: ignore[attr-defined]
         new_f.raw_address = address  # type: ignore[attr-defined]
@@ -103,13 +175,27 @@ def osc_get(
     include_original_message: bool = False,
     include_remote_addr: bool = False,
     listen: bool = True,
+    max_hz: float | None = None,
+    min_delta: float | None = None,
+    coalesce: bool = True,
+    validate: bool = True,
 ) -> Callable[..., Callable[[list[ArgValue], tuple[str, int]], list[ArgValue]]]:
+    """
+    Args:
+        validate: check the number and types of the message arguments against the handler signature, disable
+                  for trusted clients to skip the checks
+        max_hz: send listening clients at most this many updates per second
+        min_delta: only send listening clients updates that change a numeric value by at least this much
+        coalesce: with max_hz, send the latest value once the interval has passed instead of dropping it
+    """
     return wrapper(
         address,
         "get",
         include_original_message=include_original_message,
         include_remote_addr=include_remote_addr,
         listen=listen,
+        listen_options=ListenOptions(max_hz=max_hz, min_delta=min_delta, coalesce=coalesce),
+        validate=validate,
     )
 
 
@@ -117,21 +203,25 @@ def osc_set(
     address: str,
     include_original_message: bool = False,
     include_remote_addr: bool = False,
+    validate: bool = True,
 ) -> Callable[..., Callable[[list[ArgValue], tuple[str, int]], list[ArgValue]]]:
     return wrapper(
         address,
         "set",
         include_original_message=include_original_message,
         include_remote_addr=include_remote_addr,
+        validate=validate,
     )
 
 
-def _create_listener_key(address: str, remote_addr: tuple[str, int], args: list[ArgValue]) -> str:
-    return f"{remote_addr}|{address}|{args}"
+# Clients send this (under the router namespace) to renew all their listener leases.
+HEARTBEAT_ADDRESS = "/heartbeat"
 
 
 class OSCRouter:
-    _listeners: dict[str, Callable]
+    _listeners: ListenerRegistry
+    _groups: dict[GroupKey, ListenerGroup]
+    _pending_throttles: dict[GroupKey, ListenerThrottle]
     _routers: list[OSCRouter]
 
     def _add_router(self, *, router: OSCRouter) -> None:
@@ -143,11 +233,19 @@ class OSCRouter:
         address: str,
         handler: Callable[[list[ArgValue], tuple[str, int]], list[ArgValue]],
         handler_info: HandlerInfo | None = None,
+        inline: bool = False,
     ) -> None:
-        self._dispatcher.add_handler(address=f"{self._namespace}{address}", handler=handler, handler_info=handler_info)
+        self._dispatcher.add_handler(
+            address=f"{self._namespace}{address}",
+            handler=handler,
+            handler_info=handler_info,
+            inline=inline,
+        )
 
     # class for overriding so an implementing class can wire up the listener as sees fit,
     # but this class will maintain a dict / cache with address/callback ids etc
+    # it is called on the thread that receives the start_listen message, also when the dispatcher has an
+    # executor, and the listener must be invoked on that thread too since the listener state is not locked
     def _add_listener(self, *, address: str, listener: Callable, args: list[Any]) -> Callable[[], None] | None:
         # the method returns how to remove itself
         # this will already be validated for the appropriate address so it should be safe,
@@ -178,35 +276,32 @@ class OSCRouter:
             raise InvalidParameterValueException("Need to set either stop or start for listener")
         prefix = "/start_listen" if start else "/stop_listen"
         address: str = h.address  # type: ignore[attr-defined]
-        raw_address: str = h.raw_address  # type: ignore[attr-defined]
 
         def listener(args: list[ArgValue], remote_address: tuple[str, int]) -> None:
-            key = _create_listener_key(address=address, remote_addr=remote_address, args=args)
+            key = listener_key(address=address, remote_addr=remote_address, args=args)
             self._logger.info(key)
             if start:
                 if key not in self._listeners:
-
-                    def callback() -> None:
-                        self._dispatcher.send(
-                            address=f"{self._namespace}{address}",
-                            remote_addr=remote_address,
-                            params=h(args, remote_address),
-                            include_base_address=True,
-                        )
-
-                    added_listener = self._add_listener(address=raw_address, listener=callback, args=args)
-                    if added_listener:
-                        self._listeners[key] = added_listener
+                    # getters that take the remote address can not share their result with other clients
+                    per_client = getattr(h, "include_remote_addr", False)
+                    group_key: GroupKey = (address, key.args, key.remote_addr if per_client else None)
+                    group = self._groups.get(group_key) or self._start_group(h, group_key, args)
+                    if group is not None:
+                        group.members[key.remote_addr] = None
+                        stop_listener = functools.partial(self._leave_group, group, key.remote_addr)
+                        self._listeners.add(Subscription(key, stop_listener, group.throttle, self._lease_deadline()))
                         logging.info(f"listener added for {address} and args {args} for client@{remote_address}")
                     else:
                         logging.info(f"start listen called for {address} and args {args}, but no listener was added.")
+                elif self._listener_ttl is not None:
+                    self._listeners.renew(key, self._lease_deadline())
                 else:
                     logging.info(
                         f"listener already existing for {address} and args {args} for client@{remote_address}, "
                         f"will not add unless sending a specific callback query param trailing (|Nil|QueryId",
                     )
             elif stop and key in self._listeners:
-                self._listeners[key]()
+                self._stop_subscriptions([self._listeners.remove(key)])
                 logging.info(f"listener stopped for {address} and args {args} for client@{remote_address}")
 
             # this will also send a message on every start / stop request
@@ -219,6 +314,62 @@ class OSCRouter:
 
         return f"{prefix}{h.raw_address}", listener  # type: ignore[attr-defined,return-value]
 
+    def _start_group(
+        self,
+        h: Callable[[list[ArgValue], tuple[str, int]], list[ArgValue]],
+        group_key: GroupKey,
+        args: list[ArgValue],
+    ) -> ListenerGroup | None:
+        """
+        Add the host listener shared by all clients subscribing to the same address and args. On every change
+        the getter runs once, and its result is encoded once and sent to all members.
+        """
+        address: str = h.address  # type: ignore[attr-defined]
+        raw_address: str = h.raw_address  # type: ignore[attr-defined]
+        group = ListenerGroup(group_key)
+
+        def get() -> list[ArgValue]:
+            return h(args, group.first_member())
+
+        def push(params: list[ArgValue]) -> None:
+            if group.members:
+                self._dispatcher.send_many(
+                    address=f"{self._namespace}{address}",
+                    remote_addrs=list(group.members),
+                    params=params,
+                    include_base_address=True,
+                )
+
+        options: ListenOptions | None = getattr(h, "listen_options", None)
+        if options is not None and options.throttled:
+            throttle = ListenerThrottle(options=options, get=get, send=push)
+            group.throttle = throttle
+
+            def callback() -> None:
+                if throttle.notify():
+                    self._pending_throttles[group_key] = throttle
+
+        else:
+
+            def callback() -> None:
+                push(get())
+
+        stop = self._add_listener(address=raw_address, listener=callback, args=args)
+        if not stop:
+            return None
+        group.stop = stop
+        self._groups[group_key] = group
+        return group
+
+    def _leave_group(self, group: ListenerGroup, remote_addr: tuple[str, int]) -> None:
+        group.members.pop(remote_addr, None)
+        if group.members:
+            return
+        self._groups.pop(group.key, None)
+        self._pending_throttles.pop(group.key, None)
+        if group.stop is not None:
+            group.stop()
+
     def _setup_handlers(self) -> None:
         handlers = [d[1] for d in inspect.getmembers(self) if not d[0].startswith("_") and inspect.ismethod(d[1])]
         for h in handlers:
@@ -237,35 +388,112 @@ class OSCRouter:
                         address=start_address,
                         handler=start_listen,
                         handler_info=handler_info,
+                        inline=True,
                     )
                     stop_address, stop_listen = self._setup_listener(h, stop=True)
                     self._add_handler(
                         address=stop_address,
                         handler=stop_listen,
                         handler_info=handler_info,
+                        inline=True,
                     )
 
     def clear_listeners(self) -> None:
-        pass
-        # for listener in self._listeners:
-        # call listener()
-        #     if self._song.tempo_has_listener(listener):
-        #         self._song.remove_tempo_listener(listener)
-
-    def __init__(self, *, dispatcher: Dispatcher, namespace: str) -> None:
+        """
+        Stop all listeners of all clients.
+        """
+        self._stop_subscriptions(self._listeners.clear())
+
+    def remove_client_listeners(self, remote_addr: tuple[str, int]) -> int:
+        """
+        Stop all listeners of a client, e.g. when it disconnected.
+
+        Returns:
+            number of listeners stopped
+        """
+        return self._stop_subscriptions(self._listeners.remove_client(remote_addr))
+
+    def remove_address_listeners(self, address: str) -> int:
+        """
+        Stop the listeners of all clients on an address, given as the getter address (e.g. /get/tempo).
+
+        Returns:
+            number of listeners stopped
+        """
+        if not address.startswith("/"):
+            address = f"/{address}"
+        return self._stop_subscriptions(self._listeners.remove_address(address))
+
+    def _stop_subscriptions(self, subscriptions: Sequence[Subscription | None]) -> int:
+        stopped = 0
+        for subscription in subscriptions:
+            if subscription is None:
+                continue
+            try:
+                subscription.stop()
+            except Exception as e:  # noqa
+                self._logger.error(f"Error stopping listener {subscription.key}: {e}")
+            stopped += 1
+        return stopped
+
+    def __init__(self, *, dispatcher: Dispatcher, namespace: str, listener_ttl: float | None = None) -> None:
+        """
+        Args:
+            dispatcher: dispatcher to add the handlers to
+            namespace: address prefix of all handlers of this router
+            listener_ttl: stop listeners after this many seconds, unless the client renews them by sending the
+                          start_listen message again or by sending {namespace}/heartbeat (renews all its listeners)
+        """
+        if listener_ttl is not None and listener_ttl <= 0:
+            raise ValueError("listener_ttl must be positive")
         self._dispatcher = dispatcher
+        self._listener_ttl = listener_ttl
         if not namespace.startswith("/"):
             namespace = f"/{namespace}"
         self._namespace = namespace
         self._logger = self._dispatcher._logger
-        self._listeners = {}
+        self._listeners = ListenerRegistry()
+        self._groups = {}
+        self._pending_throttles = {}
         self._routers = []
         self._setup_handlers()
+        self._dispatcher.add_tick_handler(self._flush_throttled_listeners)
+        if listener_ttl is not None:
+            self._add_handler(address=HEARTBEAT_ADDRESS, handler=self._heartbeat, inline=True)  # type: ignore[arg-type]
+            self._dispatcher.add_tick_handler(self._expire_listeners)
+
+    def _lease_deadline(self) -> float:
+        if self._listener_ttl is None:
+            return math.inf
+        return time.monotonic() + self._listener_ttl
+
+    def _heartbeat(self, args: list[ArgValue], remote_address: tuple[str, int]) -> None:
+        renewed = self._listeners.renew_client(remote_address, self._lease_deadline())
+        self._logger.debug(f"heartbeat from client@{remote_address} renewed {renewed} listeners")
+
+    def _expire_listeners(self) -> None:
+        """
+        Stop the listeners whose lease ran out, called on every dispatcher tick.
+        """
+        expired = self._listeners.pop_expired(time.monotonic())
+        if expired:
+            self._stop_subscriptions(expired)
+            self._logger.info(f"{len(expired)} listener leases expired")
+
+    def _flush_throttled_listeners(self) -> None:
+        """
+        Send the coalesced listener updates whose max_hz interval has passed, called on every dispatcher tick.
+        """
+        if not self._pending_throttles:
+            return
+        now = time.monotonic()
+        for key, throttle in list(self._pending_throttles.items()):
+            if not throttle.flush(now):
+                del self._pending_throttles[key]
 
     def _clear_listeners(self) -> None:
-        for stop_listener in self._listeners.values():
-            stop_listener()
+        self.clear_listeners()
 
 
-class InvalidParameterValueException(Exception):
+class InvalidParameterValueException(ValueError):
     pass
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Any, Callable, Hashable, Iterator, NamedTuple, Optional, Tuple
+
+from fastosc.message.arg_value import ArgValue
+from fastosc.router.throttle import ListenerThrottle
+
+
+def _freeze(value: Any) -> Hashable:  # noqa: ANN401
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, bytearray):
+        return bytes(value)
+    return value
+
+
+class ListenerKey(NamedTuple):
+    remote_addr: tuple[str, int]
+    address: str
+    args: tuple[Hashable, ...]
+
+
+def listener_key(*, address: str, remote_addr: tuple[str, int], args: list[ArgValue]) -> ListenerKey:
+    """
+    Key of the subscription of a client to an address with the given args (list args become tuples).
+    """
+    return ListenerKey(tuple(remote_addr), address, tuple(_freeze(a) for a in args))  # type: ignore[arg-type]
+
+
+class Subscription:
+    __slots__ = ("expires_at", "key", "stop", "throttle")
+
+    def __init__(
+        self,
+        key: ListenerKey,
+        stop: Callable[[], None],
+        throttle: ListenerThrottle | None = None,
+        expires_at: float = math.inf,
+    ) -> None:
+        self.key = key
+        self.stop = stop
+        self.throttle = throttle
+        # time.monotonic() deadline of the lease, inf for subscriptions that never expire
+        self.expires_at = expires_at
+
+
+class ListenerRegistry:
+    """
+    Active listener subscriptions, indexed by key, by client and by address, so all subscriptions of a client
+    or of an address can be dropped without scanning the others.
+
+    Subscriptions with a lease are also kept in a min-heap on their deadline. Renewing a lease pushes a new
+    entry and leaves the old one in place, stale entries are skipped when they come up in pop_expired().
+    """
+
+    def __init__(self) -> None:
+        self._subscriptions: dict[ListenerKey, Subscription] = {}
+        self._by_client: dict[tuple[str, int], set[ListenerKey]] = {}
+        self._by_address: dict[str, set[ListenerKey]] = {}
+        self._leases: list[tuple[float, ListenerKey]] = []
+
+    def add(self, subscription: Subscription) -> None:
+        key = subscription.key
+        self.remove(key)
+        self._subscriptions[key] = subscription
+        self._by_client.setdefault(key.remote_addr, set()).add(key)
+        self._by_address.setdefault(key.address, set()).add(key)
+        if subscription.expires_at != math.inf:
+            heapq.heappush(self._leases, (subscription.expires_at, key))
+
+    def renew(self, key: ListenerKey, expires_at: float) -> bool:
+        """
+        Extend the lease of a subscription.
+
+        Returns:
+            False if there is no such subscription
+        """
+        subscription = self._subscriptions.get(key)
+        if subscription is None:
+            return False
+        subscription.expires_at = expires_at
+        heapq.heappush(self._leases, (expires_at, key))
+        return True
+
+    def renew_client(self, remote_addr: tuple[str, int], expires_at: float) -> int:
+        """
+        Extend the leases of all subscriptions of a client.
+
+        Returns:
+            number of subscriptions renewed
+        """
+        keys = self._by_client.get(tuple(remote_addr), set())  # type: ignore[arg-type]
+        for key in keys:
+            self.renew(key, expires_at)
+        return len(keys)
+
+    def pop_expired(self, now: float) -> list[Subscription]:
+        """
+        Remove the subscriptions whose lease ended at or before now, the caller is responsible for stopping them.
+        """
+        expired: list[Subscription] = []
+        leases = self._leases
+        while leases and leases[0][0] <= now:
+            deadline, key = heapq.heappop(leases)
+            subscription = self._subscriptions.get(key)
+            # skip entries of removed subscriptions and of leases renewed since
+            if subscription is not None and subscription.expires_at == deadline:
+                self.remove(key)
+                expired.append(subscription)
+        return expired
+
+    def get(self, key: ListenerKey) -> Subscription | None:
+        return self._subscriptions.get(key)
+
+    def remove(self, key: ListenerKey) -> Subscription | None:
+        """
+        Remove a subscription, the caller is responsible for stopping it.
+        """
+        subscription = self._subscriptions.pop(key, None)
+        if subscription is None:
+            return None
+        self._discard(self._by_client, key.remote_addr, key)
+        self._discard(self._by_address, key.address, key)
+        return subscription
+
+    @staticmethod
+    def _discard(index: dict[Any, set[ListenerKey]], index_key: Hashable, key: ListenerKey) -> None:
+        keys = index.get(index_key)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del index[index_key]
+
+    def remove_client(self, remote_addr: tuple[str, int]) -> list[Subscription]:
+        """
+        Remove all subscriptions of a client.
+        """
+        keys = self._by_client.get(tuple(remote_addr), set())  # type: ignore[arg-type]
+        return [s for s in (self.remove(key) for key in list(keys)) if s is not None]
+
+    def remove_address(self, address: str) -> list[Subscription]:
+        """
+        Remove all subscriptions to an address.
+        """
+        keys = self._by_address.get(address, set())
+        return [s for s in (self.remove(key) for key in list(keys)) if s is not None]
+
+    def clear(self) -> list[Subscription]:
+        """
+        Remove all subscriptions.
+        """
+        subscriptions = list(self._subscriptions.values())
+        self._subscriptions = {}
+        self._by_client = {}
+        self._by_address = {}
+        self._leases = []
+        return subscriptions
+
+    def clients(self) -> list[tuple[str, int]]:
+        return list(self._by_client)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._subscriptions
+
+    def __iter__(self) -> Iterator[Subscription]:
+        return iter(list(self._subscriptions.values()))
+
+    def __len__(self) -> int:
+        return len(self._subscriptions)
+
+
+# (address, args, remote_addr) where remote_addr is only set for getters that depend on the client
+GroupKey = Tuple[str, Tuple[Hashable, ...], Optional[Tuple[str, int]]]
+
+
+class ListenerGroup:
+    """
+    The clients subscribed to the same address and args. They share one host listener, so a change is read
+    and encoded once and then sent to every member.
+    """
+
+    __slots__ = ("key", "members", "stop", "throttle")
+
+    def __init__(self, key: GroupKey) -> None:
+        self.key = key
+        # insertion ordered set
+        self.members: dict[tuple[str, int], None] = {}
+        self.stop: Callable[[], None] | None = None
+        self.throttle: ListenerThrottle | None = None
+
+    def first_member(self) -> tuple[str, int]:
+        return next(iter(self.members))
+
+    def __len__(self) -> int:
+        return len(self.members)
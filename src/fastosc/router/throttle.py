@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from fastosc.message.arg_value import ArgValue
+
+
+@dataclass(frozen=True)
+class ListenOptions:
+    """
+    Rate limiting of the updates sent to a listening client.
+
+    Args:
+        max_hz: max number of updates per second, unlimited if None
+        min_delta: skip updates where no numeric value changed by at least this much (other values must be equal)
+        coalesce: send the latest value once the max_hz interval has passed, instead of dropping updates that
+                  came in too soon
+    """
+
+    max_hz: float | None = None
+    min_delta: float | None = None
+    coalesce: bool = True
+
+    def __post_init__(self) -> None:
+        if self.max_hz is not None and self.max_hz <= 0:
+            raise ValueError("max_hz must be positive")
+        if self.min_delta is not None and self.min_delta < 0:
+            raise ValueError("min_delta must not be negative")
+
+    @property
+    def throttled(self) -> bool:
+        return self.max_hz is not None or self.min_delta is not None
+
+
+def _is_number(value: ArgValue) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def changed_by(previous: list[ArgValue], current: list[ArgValue], min_delta: float) -> bool:
+    """
+    Returns whether current differs from previous by at least min_delta in a numeric value, or at all in any
+    other value.
+    """
+    if len(previous) != len(current):
+        return True
+    for old, new in zip(previous, current):
+        if _is_number(old) and _is_number(new):
+            if abs(new - old) >= min_delta:  # type: ignore[operator]
+                return True
+        elif old != new:
+            return True
+    return False
+
+
+class ListenerThrottle:
+    """
+    Gate between a listener callback and the update sent to the client. The value is only read when an
+    update is actually sent, so a coalesced update always carries the freshest value.
+    """
+
+    def __init__(
+        self,
+        *,
+        options: ListenOptions,
+        get: Callable[[], list[ArgValue]],
+        send: Callable[[list[ArgValue]], None],
+    ) -> None:
+        self._options = options
+        self._interval = 1 / options.max_hz if options.max_hz is not None else 0.0
+        self._get = get
+        self._send = send
+        self._next_at = 0.0
+        self._last: list[ArgValue] | None = None
+        self.pending = False
+
+    def notify(self) -> bool:
+        """
+        Called on every change of the value. Sends an update right away when allowed.
+
+        Returns:
+            True if an update is pending and has to be sent by a later flush()
+        """
+        now = time.monotonic()
+        if now < self._next_at:
+            self.pending = self._options.coalesce
+            return self.pending
+        self._emit(now)
+        return False
+
+    def flush(self, now: float) -> bool:
+        """
+        Send the pending update if its interval has passed.
+
+        Returns:
+            True if the update is still pending
+        """
+        if not self.pending:
+            return False
+        if now < self._next_at:
+            return True
+        self._emit(now)
+        return False
+
+    def _emit(self, now: float) -> None:
+        self.pending = False
+        params = self._get()
+        min_delta = self._options.min_delta
+        if min_delta is not None and not inspect.isawaitable(params):
+            if self._last is not None and not changed_by(self._last, params, min_delta):
+                return
+            self._last = params
+        self._next_at = now + self._interval
+        self._send(params)
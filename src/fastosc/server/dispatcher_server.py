@@ -4,6 +4,9 @@ import logging
 from abc import ABC
 
 from fastosc.dispatcher import Dispatcher
+from fastosc.message.osc_bundle import OscBundle
+from fastosc.message.osc_message import OscMessage
+from fastosc.message.parsing.osc_types import Buffer
 from fastosc.server.server_base import OSCServerBase
 
 
@@ -12,3 +15,15 @@ class OSCDispatcherServer(OSCServerBase, ABC):
         super().__init__(logger, local_addr)
         self._dispatcher = dispatcher
         self._dispatcher.set_server(self)
+
+    def _tick(self) -> None:
+        self._dispatcher.tick()
+        self.flush_outbound()
+
+    def _parse_datagram(self, *, data: Buffer, remote_addr: tuple[str, int]) -> None:
+        if OscMessage.dgram_is_message(data):
+            self._dispatcher.process_message(message=OscMessage(data, lazy=True), remote_addr=remote_addr)
+        elif OscBundle.dgram_is_bundle(data):
+            self._dispatcher.process_bundle(bundle=OscBundle(data), remote_addr=remote_addr)
+        else:
+            logging.debug(f"unknown osc message: {data} from {remote_addr}")  # type: ignore[str-bytes-safe]
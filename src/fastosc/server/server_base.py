@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
+import threading
 import traceback
 from abc import ABC, abstractmethod
 
 from fastosc.message.arg_value import ArgValue
+from fastosc.message.batch import DEFAULT_MTU, MessageBatcher
 from fastosc.message.convert import convert_message
 from fastosc.message.osc_message_builder import BuildError
 
@@ -13,6 +15,9 @@ class OSCServerBase(ABC):
     def __init__(self, logger: logging.Logger, local_addr: tuple[str, int]) -> None:
         self._logger = logger
         self._local_addr = local_addr
+        self._outbound: MessageBatcher | None = None
+        self._outbound_lock = threading.Lock()
+        self._flush_stop: threading.Event | None = None
         self._logger.info("Starting OSC server (local %s)", str(self._local_addr))
 
     @abstractmethod
@@ -21,6 +26,89 @@ class OSCServerBase(ABC):
 
     def send(self, *, address: str, params: list[ArgValue], remote_addr: tuple[str, int]) -> None:
         try:
-            self._send_bytes(data=convert_message(address=address, params=params), remote_addr=remote_addr)
+            data = convert_message(address=address, params=params)
         except BuildError:
             self._logger.error(f"OSC build error: {traceback.format_exc()}")
+            return
+        self._send_encoded(data=data, address=address, remote_addr=remote_addr)
+
+    def send_many(self, *, address: str, params: list[ArgValue], remote_addrs: list[tuple[str, int]]) -> None:
+        """
+        Send the same message to several remote addresses, encoding it only once.
+        """
+        if not remote_addrs:
+            return
+        try:
+            data = convert_message(address=address, params=params)
+        except BuildError:
+            self._logger.error(f"OSC build error: {traceback.format_exc()}")
+            return
+        for remote_addr in remote_addrs:
+            self._send_encoded(data=data, address=address, remote_addr=remote_addr)
+
+    def _send_encoded(self, *, data: bytes, address: str, remote_addr: tuple[str, int]) -> None:
+        if self._outbound is None:
+            self._send_bytes(data=data, remote_addr=remote_addr)
+            return
+        with self._outbound_lock:
+            ready = self._outbound.add(remote_addr, data, address=address)
+        for dgram in ready:
+            self._send_bytes(data=dgram, remote_addr=remote_addr)
+
+    def enable_send_coalescing(
+        self,
+        *,
+        mtu: int = DEFAULT_MTU,
+        dedupe: bool = False,
+        flush_interval: float | None = None,
+    ) -> None:
+        """
+        Queue outgoing messages per destination instead of sending them one by one. Queued messages are packed
+        into bundles of at most mtu bytes when flush_outbound() is called, which pull servers do at the end of
+        every process() tick.
+
+        Args:
+            mtu: max size of a bundle
+            dedupe: a message for an address replaces a queued message for the same address and destination,
+                    even if their args differ (e.g. replies for different tracks on the same address)
+            flush_interval: also flush from a background thread every flush_interval seconds (for handlers
+                            running on other threads)
+        """
+        self.disable_send_coalescing()
+        self._outbound = MessageBatcher(mtu=mtu, dedupe=dedupe)
+        if flush_interval is not None:
+            self._flush_stop = threading.Event()
+            threading.Thread(
+                target=self._flush_periodically,
+                args=(self._flush_stop, flush_interval),
+                name="fastosc-flush",
+                daemon=True,
+            ).start()
+
+    def disable_send_coalescing(self) -> None:
+        """
+        Send queued messages and go back to sending every message right away.
+        """
+        if self._flush_stop is not None:
+            self._flush_stop.set()
+            self._flush_stop = None
+        self.flush_outbound()
+        self._outbound = None
+
+    def _flush_periodically(self, stop: threading.Event, interval: float) -> None:
+        while not stop.wait(interval):
+            try:
+                self.flush_outbound()
+            except Exception as e:  # noqa
+                self._logger.error(f"Error sending OSC messages: {e}")
+
+    def flush_outbound(self) -> None:
+        """
+        Send all queued outgoing messages, packed into bundles per destination.
+        """
+        if self._outbound is None:
+            return
+        with self._outbound_lock:
+            ready = self._outbound.flush_all()
+        for remote_addr, dgram in ready:
+            self._send_bytes(data=dgram, remote_addr=remote_addr)
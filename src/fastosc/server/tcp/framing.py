@@ -0,0 +1,122 @@
+"""Stream framing of OSC packets: OSC 1.0 int32 length prefix and OSC 1.1 double-END SLIP."""
+
+from __future__ import annotations
+
+import struct
+
+FRAMING_LENGTH_PREFIX = "length_prefix"
+FRAMING_SLIP = "slip"
+SUPPORTED_FRAMINGS = (FRAMING_LENGTH_PREFIX, FRAMING_SLIP)
+
+DEFAULT_MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+_LENGTH = struct.Struct(">i")
+
+_SLIP_END = b"\xc0"
+_SLIP_ESC = b"\xdb"
+_SLIP_ESC_END = b"\xdb\xdc"
+_SLIP_ESC_ESC = b"\xdb\xdd"
+
+
+class FramingError(Exception):
+    """Raised when a stream contains an invalid or oversized frame."""
+
+
+def encode_length_prefixed(packet: bytes) -> bytes:
+    """Frame an OSC packet with its int32 big-endian size (OSC 1.0)."""
+    return _LENGTH.pack(len(packet)) + packet
+
+
+def encode_slip(packet: bytes) -> bytes:
+    """Frame an OSC packet with SLIP, delimited by an END byte on both sides (OSC 1.1)."""
+    return _SLIP_END + packet.replace(_SLIP_ESC, _SLIP_ESC_ESC).replace(_SLIP_END, _SLIP_ESC_END) + _SLIP_END
+
+
+class LengthPrefixDecoder:
+    """Incremental decoder for length prefixed frames.
+
+    Partial frames stay in the buffer until the rest arrives, complete frames are copied out once.
+    """
+
+    def __init__(self, max_frame_size: int = DEFAULT_MAX_FRAME_SIZE) -> None:
+        self._buffer = bytearray()
+        self._max_frame_size = max_frame_size
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Add received data and return the packets of all frames completed by it.
+
+        Raises:
+          FramingError if a frame announces a negative or too large size.
+        """
+        buffer = self._buffer
+        buffer += data
+        frames = []
+        index = 0
+        end = len(buffer)
+        while end - index >= _LENGTH.size:
+            size = _LENGTH.unpack_from(buffer, index)[0]
+            if size < 0 or size > self._max_frame_size:
+                raise FramingError(f"Invalid frame size {size}")
+            if end - index - _LENGTH.size < size:
+                break
+            index += _LENGTH.size
+            frames.append(bytes(buffer[index : index + size]))
+            index += size
+        if index:
+            # deleting from the front of a bytearray only moves its start offset
+            del buffer[:index]
+        return frames
+
+
+class SlipDecoder:
+    """Incremental decoder for SLIP frames.
+
+    Only bytes received since the last call are scanned for END, and escapes are only undone on complete frames.
+    """
+
+    def __init__(self, max_frame_size: int = DEFAULT_MAX_FRAME_SIZE) -> None:
+        self._buffer = bytearray()
+        self._scanned = 0
+        self._max_frame_size = max_frame_size
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Add received data and return the packets of all frames completed by it.
+
+        Raises:
+          FramingError if a frame grows beyond max_frame_size.
+        """
+        buffer = self._buffer
+        buffer += data
+        frames = []
+        start = 0
+        end = buffer.find(_SLIP_END, self._scanned)
+        while end != -1:
+            if end > start:
+                frame = bytes(buffer[start:end])
+                if _SLIP_ESC in frame:
+                    frame = frame.replace(_SLIP_ESC_END, _SLIP_END).replace(_SLIP_ESC_ESC, _SLIP_ESC)
+                frames.append(frame)
+            start = end + 1
+            end = buffer.find(_SLIP_END, start)
+        if start:
+            del buffer[:start]
+        self._scanned = len(buffer)
+        if self._scanned > self._max_frame_size:
+            raise FramingError(f"Frame exceeds {self._max_frame_size} bytes")
+        return frames
+
+
+def encode_frame(packet: bytes, framing: str) -> bytes:
+    """Frame an OSC packet for a stream with the given framing."""
+    if framing == FRAMING_SLIP:
+        return encode_slip(packet)
+    return encode_length_prefixed(packet)
+
+
+def create_decoder(framing: str, max_frame_size: int = DEFAULT_MAX_FRAME_SIZE) -> LengthPrefixDecoder | SlipDecoder:
+    """Returns a new incremental decoder for the given framing."""
+    if framing not in SUPPORTED_FRAMINGS:
+        raise ValueError(f"framing must be one of {SUPPORTED_FRAMINGS}")
+    if framing == FRAMING_SLIP:
+        return SlipDecoder(max_frame_size)
+    return LengthPrefixDecoder(max_frame_size)
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import logging
+import select
+import socket
+import threading
+import traceback
+
+from fastosc.dispatcher import Dispatcher
+from fastosc.message.arg_value import ArgValue
+from fastosc.server.dispatcher_server import OSCDispatcherServer
+from fastosc.server.tcp.framing import (
+    DEFAULT_MAX_FRAME_SIZE,
+    FRAMING_SLIP,
+    SUPPORTED_FRAMINGS,
+    FramingError,
+)
+from fastosc.server.tcp.tcp_connection import OSCStreamConnection, SendQueue
+
+DEFAULT_CONNECT_TIMEOUT = 5.0
+
+
+class OSCTCPClient(OSCDispatcherServer):
+    """
+    Client side of an OSC TCP connection. Messages are sent to the server it connected to, and packets
+    coming back (replies, listener updates) are dispatched to its own Dispatcher by process(). Sends from other
+    threads than the one calling process() are queued and written out by process().
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        dispatcher: Dispatcher,
+        logger: logging.Logger,
+        remote_addr: tuple[str, int],
+        framing: str = FRAMING_SLIP,
+        max_frame_size: int = DEFAULT_MAX_FRAME_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    ) -> None:
+        if framing not in SUPPORTED_FRAMINGS:
+            raise ValueError(f"framing must be one of {SUPPORTED_FRAMINGS}")
+        sock = socket.create_connection(remote_addr, timeout=connect_timeout)
+        super().__init__(logger=logger, dispatcher=dispatcher, local_addr=sock.getsockname())
+        self._remote_addr = remote_addr
+        self._connection: OSCStreamConnection | None = OSCStreamConnection(
+            sock,
+            remote_addr,
+            framing,
+            max_frame_size,
+        )
+        self._process_thread = threading.current_thread()
+        self._send_queue = SendQueue()
+
+    @property
+    def connected(self) -> bool:
+        return self._connection is not None
+
+    def send_message(self, *, address: str, params: list[ArgValue]) -> None:
+        """
+        Send a message to the server.
+        """
+        self.send(address=address, params=params, remote_addr=self._remote_addr)
+
+    def _send_queued(self) -> None:
+        for data, remote_addr in self._send_queue.drain():
+            self._send_bytes(data=data, remote_addr=remote_addr)
+
+    def _send_bytes(self, data: bytes, remote_addr: tuple[str, int]) -> None:
+        if threading.current_thread() is not self._process_thread:
+            self._send_queue.put(data, remote_addr)
+            return
+        if self._connection is None:
+            self._logger.error(f"Trying to send OSC message to {self._remote_addr}, but the connection is closed")
+            return
+        try:
+            self._connection.write(data)
+        except OSError as e:
+            self._logger.error(f"OSC connection to {self._remote_addr} failed: {e}")
+            self.shutdown()
+
+    def process(self, timeout: float = 0) -> bool:
+        """
+        Send pending output and dispatch all complete packets received from the server.
+
+        Args:
+            timeout: seconds to wait for data, 0 returns immediately
+
+        Returns:
+            False once the connection is closed
+        """
+        self._process_thread = threading.current_thread()
+        self.flush_outbound()
+        self._send_queued()
+        connection = self._connection
+        if connection is None:
+            return False
+        writers = [connection.socket] if connection.has_pending_output else []
+        readers = [connection.socket, self._send_queue.socket]
+        readable, writable, _ = select.select(readers, writers, [], timeout)
+        self._send_queued()
+        if self._connection is None:
+            return False
+        try:
+            if writable:
+                connection.flush()
+            if connection.socket not in readable:
+                return True
+            packets = connection.read()
+        except (FramingError, OSError) as e:
+            self._logger.error(f"OSC connection to {self._remote_addr} failed: {e}")
+            self.shutdown()
+            return False
+        if packets is None:
+            self._logger.info(f"OSC connection closed by {self._remote_addr}")
+            self.shutdown()
+            return False
+        for packet in packets:
+            try:
+                self._parse_datagram(data=packet, remote_addr=self._remote_addr)
+            except Exception as e:  # noqa
+                self._logger.error(f"Error handling OSC message: {e}")
+                self._logger.warning(f"{traceback.format_exc()}")
+        self._tick()
+        self._send_queued()
+        return True
+
+    def shutdown(self) -> None:
+        """
+        Close the connection.
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+            self._send_queue.close()
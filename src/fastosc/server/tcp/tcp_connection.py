@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import contextlib
+import socket
+from collections import deque
+
+from fastosc.server.tcp.framing import DEFAULT_MAX_FRAME_SIZE, create_decoder, encode_frame
+
+RECV_SIZE = 65536
+
+
+class OSCStreamConnection:
+    """
+    A non-blocking stream socket carrying framed OSC packets.
+
+    Outgoing frames that the socket does not accept right away are kept in an output buffer
+    until flush() is called again (when the socket becomes writable).
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        remote_addr: tuple[str, int],
+        framing: str,
+        max_frame_size: int = DEFAULT_MAX_FRAME_SIZE,
+    ) -> None:
+        sock.setblocking(False)  # noqa: FBT003
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.socket = sock
+        self.remote_addr = remote_addr
+        self._framing = framing
+        self._decoder = create_decoder(framing, max_frame_size)
+        self._out = bytearray()
+
+    def read(self) -> list[bytes] | None:
+        """
+        Read available data and return the complete packets received, or None once the peer closed the connection.
+
+        Raises:
+            FramingError if the stream is corrupt.
+        """
+        try:
+            data = self.socket.recv(RECV_SIZE)
+        except (BlockingIOError, InterruptedError):
+            return []
+        if not data:
+            return None
+        return self._decoder.feed(data)
+
+    def write(self, packet: bytes) -> None:
+        """
+        Frame a packet and send as much as the socket accepts, buffering the rest.
+        """
+        self._out += encode_frame(packet, self._framing)
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Send buffered output.
+        """
+        while self._out:
+            try:
+                sent = self.socket.send(self._out)
+            except (BlockingIOError, InterruptedError):
+                return
+            del self._out[:sent]
+
+    @property
+    def has_pending_output(self) -> bool:
+        return bool(self._out)
+
+    def close(self) -> None:
+        self.socket.close()
+
+
+class SendQueue:
+    """
+    Packets sent from other threads than the one running process() (e.g. replies of handlers running on a
+    dispatcher executor), which must not touch the connections. They are queued here and written out by
+    process(), which is woken up through a socket pair that is part of its select().
+    """
+
+    def __init__(self) -> None:
+        self._pending: deque[tuple[bytes, tuple[str, int]]] = deque()
+        self._reader, self._writer = socket.socketpair()
+        self._reader.setblocking(False)  # noqa: FBT003
+        self._writer.setblocking(False)  # noqa: FBT003
+
+    @property
+    def socket(self) -> socket.socket:
+        """Becomes readable when packets were queued."""
+        return self._reader
+
+    def put(self, data: bytes, remote_addr: tuple[str, int]) -> None:
+        self._pending.append((data, remote_addr))
+        # a full socket buffer means a wake up is pending already
+        with contextlib.suppress(OSError):
+            self._writer.send(b"\x00")
+
+    def drain(self) -> list[tuple[bytes, tuple[str, int]]]:
+        with contextlib.suppress(OSError):
+            while self._reader.recv(RECV_SIZE):
+                pass
+        packets = []
+        while self._pending:
+            packets.append(self._pending.popleft())
+        return packets
+
+    def close(self) -> None:
+        self._reader.close()
+        self._writer.close()
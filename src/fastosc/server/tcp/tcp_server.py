@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import contextlib
+import logging
+import selectors
+import socket
+import threading
+import traceback
+
+from fastosc.dispatcher import Dispatcher
+from fastosc.server.dispatcher_server import OSCDispatcherServer
+from fastosc.server.tcp.framing import (
+    DEFAULT_MAX_FRAME_SIZE,
+    FRAMING_SLIP,
+    SUPPORTED_FRAMINGS,
+    FramingError,
+)
+from fastosc.server.tcp.tcp_connection import OSCStreamConnection, SendQueue
+
+DEFAULT_BACKLOG = 16
+
+
+class OSCTCPServer(OSCDispatcherServer):
+    """
+    OSC TCP server with a process() method to pull in data from all connected clients, in the same way as
+    OSCUDPPullServer. Packets are framed with SLIP (OSC 1.1) or an int32 length prefix (OSC 1.0), which
+    allows packets larger than a datagram. Replies are sent back on the connection of the remote address.
+    Sends from other threads than the one calling process() are queued and written out by process().
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        dispatcher: Dispatcher,
+        logger: logging.Logger,
+        local_addr: tuple[str, int],
+        framing: str = FRAMING_SLIP,
+        max_frame_size: int = DEFAULT_MAX_FRAME_SIZE,
+    ) -> None:
+        if framing not in SUPPORTED_FRAMINGS:
+            raise ValueError(f"framing must be one of {SUPPORTED_FRAMINGS}")
+        super().__init__(logger=logger, dispatcher=dispatcher, local_addr=local_addr)
+        self._framing = framing
+        self._max_frame_size = max_frame_size
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._socket.bind(self._local_addr)
+        self._socket.listen(DEFAULT_BACKLOG)
+        self._socket.setblocking(False)  # noqa: FBT003
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._socket, selectors.EVENT_READ, None)
+        self._connections: dict[tuple[str, int], OSCStreamConnection] = {}
+        self._events: dict[tuple[str, int], int] = {}
+        self._process_thread = threading.current_thread()
+        self._send_queue = SendQueue()
+        self._selector.register(self._send_queue.socket, selectors.EVENT_READ, self._send_queue)
+
+    @property
+    def connections(self) -> list[tuple[str, int]]:
+        """Remote addresses of the connected clients."""
+        return list(self._connections)
+
+    def process(self, timeout: float = 0) -> None:
+        """
+        Accept new connections, dispatch all complete packets received and send pending output.
+
+        Args:
+            timeout: seconds to wait for activity, 0 returns immediately
+        """
+        self._process_thread = threading.current_thread()
+        for key, events in self._selector.select(timeout):
+            if key.data is None:
+                self._accept()
+                continue
+            if key.data is self._send_queue:
+                continue
+            connection: OSCStreamConnection = key.data
+            if events & selectors.EVENT_WRITE:
+                try:
+                    connection.flush()
+                except OSError:
+                    self._close(connection)
+                    continue
+            if events & selectors.EVENT_READ:
+                self._read(connection)
+            if connection.remote_addr in self._connections:
+                self._update_events(connection)
+        self._send_queued()
+        self._tick()
+        self._send_queued()
+
+    def _accept(self) -> None:
+        try:
+            sock, remote_addr = self._socket.accept()
+        except (BlockingIOError, InterruptedError):
+            return
+        connection = OSCStreamConnection(sock, remote_addr, self._framing, self._max_frame_size)
+        self._connections[remote_addr] = connection
+        self._events[remote_addr] = selectors.EVENT_READ
+        self._selector.register(sock, selectors.EVENT_READ, connection)
+        self._logger.info(f"OSC client connected: {remote_addr}")
+
+    def _read(self, connection: OSCStreamConnection) -> None:
+        try:
+            packets = connection.read()
+        except (FramingError, OSError) as e:
+            self._logger.error(f"Closing OSC connection {connection.remote_addr}: {e}")
+            self._close(connection)
+            return
+        if packets is None:
+            self._close(connection)
+            return
+        for packet in packets:
+            try:
+                self._parse_datagram(data=packet, remote_addr=connection.remote_addr)
+            except Exception as e:  # noqa
+                self._logger.error(f"Error handling OSC message: {e}")
+                self._logger.warning(f"{traceback.format_exc()}")
+
+    def _update_events(self, connection: OSCStreamConnection) -> None:
+        events = selectors.EVENT_READ
+        if connection.has_pending_output:
+            events |= selectors.EVENT_WRITE
+        if self._events.get(connection.remote_addr) != events:
+            self._events[connection.remote_addr] = events
+            self._selector.modify(connection.socket, events, connection)
+
+    def _close(self, connection: OSCStreamConnection) -> None:
+        self._connections.pop(connection.remote_addr, None)
+        self._events.pop(connection.remote_addr, None)
+        with contextlib.suppress(KeyError, ValueError):
+            self._selector.unregister(connection.socket)
+        connection.close()
+        self._logger.info(f"OSC client disconnected: {connection.remote_addr}")
+
+    def _send_queued(self) -> None:
+        for data, remote_addr in self._send_queue.drain():
+            self._send_bytes(data=data, remote_addr=remote_addr)
+
+    def _send_bytes(self, data: bytes, remote_addr: tuple[str, int]) -> None:
+        if threading.current_thread() is not self._process_thread:
+            self._send_queue.put(data, remote_addr)
+            return
+        connection = self._connections.get(remote_addr)
+        if connection is None:
+            self._logger.warning(f"Trying to send OSC message to {remote_addr}, but it is not connected")
+            return
+        try:
+            connection.write(data)
+        except OSError as e:
+            self._logger.error(f"Closing OSC connection {remote_addr}: {e}")
+            self._close(connection)
+            return
+        self._update_events(connection)
+
+    def shutdown(self) -> None:
+        """
+        Close all client connections and the server socket.
+        """
+        for connection in list(self._connections.values()):
+            self._close(connection)
+        self._selector.close()
+        self._send_queue.close()
+        self._socket.close()
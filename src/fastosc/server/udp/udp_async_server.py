@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import traceback
+
+from fastosc.dispatcher import Dispatcher
+from fastosc.server.dispatcher_server import OSCDispatcherServer
+
+# Seconds between dispatcher ticks (deferred listener updates, queued output).
+DEFAULT_TICK_INTERVAL = 0.005
+
+
+class _OSCDatagramProtocol(asyncio.DatagramProtocol):
+    def __init__(self, server: OSCUDPAsyncServer) -> None:
+        self._server = server
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        self._server._datagram_received(data=data, remote_addr=addr)
+
+    def error_received(self, exc: Exception) -> None:
+        self._server._logger.warning(f"Non-fatal socket error: {exc}")
+
+
+class OSCUDPAsyncServer(OSCDispatcherServer):
+    """
+    OSC Udp server running on an asyncio event loop, for standalone processes (outside of Ableton) where
+    an event loop is available. Datagrams are dispatched as they arrive, replies are sent through the
+    datagram transport without blocking, and `async def` handlers are awaited as tasks on the loop.
+
+    Usage:
+        server = OSCUDPAsyncServer(dispatcher=dispatcher, logger=logger, local_addr=("0.0.0.0", 11000))
+        await server.start()
+        ...
+        server.shutdown()
+    """
+
+    def __init__(
+        self,
+        *,
+        dispatcher: Dispatcher,
+        logger: logging.Logger,
+        local_addr: tuple[str, int],
+        tick_interval: float = DEFAULT_TICK_INTERVAL,
+    ) -> None:
+        super().__init__(logger=logger, dispatcher=dispatcher, local_addr=local_addr)
+        self._tick_interval = tick_interval
+        self._tick_handle: asyncio.TimerHandle | None = None
+        self._transport: asyncio.DatagramTransport | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        self._flush_scheduled = False
+
+    async def start(self) -> None:
+        """
+        Bind the server socket on the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        self._loop = loop
+        self._loop_thread = threading.current_thread()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            lambda: _OSCDatagramProtocol(self),
+            local_addr=self._local_addr,
+        )
+        self._tick_handle = loop.call_later(self._tick_interval, self._run_tick)
+
+    def _run_tick(self) -> None:
+        self._tick()
+        if self._transport is not None and self._loop is not None:
+            self._tick_handle = self._loop.call_later(self._tick_interval, self._run_tick)
+
+    def _datagram_received(self, *, data: bytes, remote_addr: tuple[str, int]) -> None:
+        try:
+            self._parse_datagram(data=data, remote_addr=remote_addr)
+        except Exception as e:  # noqa
+            self._logger.error(f"Error handling OSC message: {e}")
+            self._logger.warning(f"{traceback.format_exc()}")
+
+    def _send_encoded(self, *, data: bytes, address: str, remote_addr: tuple[str, int]) -> None:
+        super()._send_encoded(data=data, address=address, remote_addr=remote_addr)
+        # with send coalescing, everything queued during this loop iteration goes out in one flush
+        if self._outbound is not None and self._loop is not None and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._loop.call_soon_threadsafe(self._flush_queued)
+
+    def _flush_queued(self) -> None:
+        self._flush_scheduled = False
+        self.flush_outbound()
+
+    def _send_bytes(self, data: bytes, remote_addr: tuple[str, int]) -> None:
+        if self._transport is None or self._loop is None:
+            self._logger.error(f"Trying to send OSC message to {remote_addr}, but the server is not started")
+            return
+        if threading.current_thread() is not self._loop_thread:
+            # replies from handlers running on a dispatcher executor thread
+            self._loop.call_soon_threadsafe(self._send_bytes, data, remote_addr)
+            return
+        self._transport.sendto(data, remote_addr)
+
+    def shutdown(self) -> None:
+        """
+        Shutdown the server transport.
+        """
+        if self._tick_handle is not None:
+            self._tick_handle.cancel()
+            self._tick_handle = None
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import errno
 import logging
+import time
 import traceback
 
 from fastosc.dispatcher import Dispatcher
 from fastosc.server.udp.udp_server_base import OSCUDPServerBase
 
+# Largest possible UDP payload.
+MAX_DATAGRAM_SIZE = 65536
+
 
 class OSCUDPPullServer(OSCUDPServerBase):
     """
@@ -14,20 +18,54 @@ class OSCUDPPullServer(OSCUDPServerBase):
     This is more efficient in certain environments such as Ableton live embedded python which
     does not support multithreading well (i.e it gives latencies in 100+ms and cannot handle high rates of inbound
     messages without spiking latency.
+
+    Datagrams are received into one preallocated buffer, and each call to process() can be given a budget
+    (max_packets and/or max_time_us) so that bursts are spread over several ticks of the host instead of
+    blocking it until the socket is drained.
     """
 
-    def __init__(self, *, dispatcher: Dispatcher, logger: logging.Logger, local_addr: tuple[str, int]) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        dispatcher: Dispatcher,
+        logger: logging.Logger,
+        local_addr: tuple[str, int],
+        max_packets: int | None = None,
+        max_time_us: int | None = None,
+    ) -> None:
         super().__init__(logger=logger, dispatcher=dispatcher, local_addr=local_addr)
         self._socket.setblocking(False)  # noqa: FBT003
+        self._max_packets = max_packets
+        self._max_time_us = max_time_us
+        self._recv_buffer = bytearray(MAX_DATAGRAM_SIZE)
+        self._recv_view = memoryview(self._recv_buffer)
 
-    def process(self) -> None:
+    def process(self, *, max_packets: int | None = None, max_time_us: int | None = None) -> int:
         """
-        Synchronously process all data queued on the OSC socket.
+        Synchronously process data queued on the OSC socket, within the given budget.
+        Datagrams left over when the budget runs out stay queued for the next call.
+
+        Args:
+            max_packets: max number of datagrams to process, defaults to the server setting (unbounded if None)
+            max_time_us: max time to spend in microseconds, defaults to the server setting (unbounded if None)
+
+        Returns:
+            number of datagrams received
         """
+        if max_packets is None:
+            max_packets = self._max_packets
+        if max_time_us is None:
+            max_time_us = self._max_time_us
+        deadline = None if max_time_us is None else time.perf_counter() + max_time_us / 1_000_000
+        received = 0
         try:
-            while True:
-                data, remote_addr = self._socket.recvfrom(65536)
-                self._parse_datagram(data=data, remote_addr=remote_addr)
+            while max_packets is None or received < max_packets:
+                size, remote_addr = self._socket.recvfrom_into(self._recv_buffer)
+                received += 1
+                # Messages may outlive this call (lazy arguments), so they get their own copy of the datagram.
+                self._parse_datagram(data=self._recv_view[:size].tobytes(), remote_addr=remote_addr)
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
 
         except OSError as e:
             if e.errno == errno.ECONNRESET:
@@ -50,6 +88,8 @@ class OSCUDPPullServer(OSCUDPServerBase):
         except Exception as e:  # noqa
             self._logger.error(f"Error handling OSC message: {e}")
             self._logger.warning(f"{traceback.format_exc()}")
+        self._tick()
+        return received
 
     def shutdown(self) -> None:
         """
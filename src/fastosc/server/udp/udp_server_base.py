@@ -4,8 +4,6 @@ import logging
 import socket
 
 from fastosc.dispatcher import Dispatcher
-from fastosc.message.osc_bundle import OscBundle
-from fastosc.message.osc_message import OscMessage
 from fastosc.server.dispatcher_server import OSCDispatcherServer
 
 
@@ -26,10 +24,8 @@ class OSCUDPServerBase(OSCDispatcherServer):
     def _send_bytes(self, data: bytes, remote_addr: tuple[str, int]) -> None:
         self._socket.sendto(data, remote_addr)
 
-    def _parse_datagram(self, *, data: bytes, remote_addr: tuple[str, int]) -> None:
-        if OscMessage.dgram_is_message(data):
-            self._dispatcher.process_message(message=OscMessage(data), remote_addr=remote_addr)
-        elif OscBundle.dgram_is_bundle(data):
-            self._dispatcher.process_bundle(bundle=OscBundle(data), remote_addr=remote_addr)
-        else:
-            logging.debug(f"unknown osc message: {data} from {remote_addr}")  # type: ignore[str-bytes-safe]
+    def fileno(self) -> int:
+        """
+        File descriptor of the server socket, so the server can be passed to select().
+        """
+        return self._socket.fileno()
@@ -0,0 +1,114 @@
+# ruff: noqa: PLR0913
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import select
+from multiprocessing.synchronize import Event
+from typing import Callable
+
+from fastosc.dispatcher import Dispatcher
+from fastosc.server.udp.udp_pull_server import OSCUDPPullServer
+
+DEFAULT_POLL_INTERVAL = 0.1
+DEFAULT_MAX_PACKETS = 64
+
+
+def _run_worker(
+    dispatcher_factory: Callable[[], Dispatcher],
+    logger_name: str,
+    local_addr: tuple[str, int],
+    stop_event: Event,
+    poll_interval: float,
+    max_packets: int | None,
+) -> None:
+    logger = logging.getLogger(logger_name)
+    server = OSCUDPPullServer(
+        dispatcher=dispatcher_factory(),
+        logger=logger,
+        local_addr=local_addr,
+        max_packets=max_packets,
+    )
+    try:
+        while not stop_event.is_set():
+            select.select([server], [], [], poll_interval)
+            server.process()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+class OSCUDPWorkerPool:
+    """
+    Runs a pool of worker processes, each with its own OSCUDPPullServer bound to the same local address
+    through SO_REUSEPORT and its own Dispatcher created by dispatcher_factory.
+
+    The kernel load-balances incoming datagrams between the workers by hashing the source address, so all
+    messages of one client are handled by the same worker, in order. Workers share no state: routers and
+    listeners must be set up by the factory, which (like the logger name) has to be picklable, i.e. a module
+    level function, on platforms that spawn processes. local_addr needs an explicit port, since every worker
+    binds separately.
+    """
+
+    def __init__(
+        self,
+        *,
+        dispatcher_factory: Callable[[], Dispatcher],
+        logger: logging.Logger,
+        local_addr: tuple[str, int],
+        workers: int | None = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_packets: int | None = DEFAULT_MAX_PACKETS,
+    ) -> None:
+        if not local_addr[1]:
+            raise ValueError("OSCUDPWorkerPool needs an explicit port to share between workers")
+        self._dispatcher_factory = dispatcher_factory
+        self._logger = logger
+        self._local_addr = local_addr
+        self._workers = workers or os.cpu_count() or 1
+        self._poll_interval = poll_interval
+        self._max_packets = max_packets
+        self._stop_event = multiprocessing.Event()
+        self._processes: list[multiprocessing.Process] = []
+
+    def start(self) -> None:
+        """
+        Start the worker processes.
+        """
+        self._stop_event.clear()
+        self._logger.info("Starting %d OSC worker processes (local %s)", self._workers, str(self._local_addr))
+        for i in range(self._workers):
+            process = multiprocessing.Process(
+                target=_run_worker,
+                args=(
+                    self._dispatcher_factory,
+                    self._logger.name,
+                    self._local_addr,
+                    self._stop_event,
+                    self._poll_interval,
+                    self._max_packets,
+                ),
+                name=f"fastosc-worker-{i}",
+                daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+
+    @property
+    def alive_workers(self) -> int:
+        return sum(1 for process in self._processes if process.is_alive())
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """
+        Stop the worker processes, terminating those that did not exit within the timeout.
+        """
+        self._stop_event.set()
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                self._logger.warning(f"OSC worker {process.name} did not stop, terminating it")
+                process.terminate()
+                process.join()
+        self._processes = []